@@ -19,11 +19,11 @@ ADDING YOUR OWN SPRITES / DRAWINGS LATER
 ----------------------------------------
 - Menu clocks: In _draw_menu_impl(), replace the draw_glowing_circle() + tick
   line with a blit of your clock image centered at (cx, cy). Use _clock_center(idx).
-- Memory scene background: In _build_scenes(), after creating the gradient bg,
+- Memory scene background: In _load_scene(), after creating the gradient bg,
   load and blit your room image onto bg (e.g. pygame.image.load("room.png"))
   or use a different image per scene label.
 - Evidence: Each scene has SceneArtifact(s) with image, frac position, and tags.
-  Add more artifacts in _build_scenes and adjust frac_x/frac_y for placement.
+  Add more artifacts in SCENE_ARTIFACT_SPECS and adjust frac_x/frac_y for placement.
 - Accusation cards: In draw_accuse(), the suspect cards are drawn with
   pygame.draw.rect and text. Add a card background image and blit it per card
   before drawing name/role/motive.
@@ -31,14 +31,19 @@ ADDING YOUR OWN SPRITES / DRAWINGS LATER
   sprite for CASE CLOSED / MEMORY COLLAPSED.
 """
 
+import functools
+import hashlib
 import io
 import math
 import os
 import random
+import re
 import struct
-import wave
+import sys
 from array import array
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import List, Tuple
 
 try:
@@ -48,28 +53,97 @@ except ImportError as exc:
         "This game requires Pygame. Install with: pip install pygame"
     ) from exc
 
+try:
+    import numpy as np
+except ImportError:  # optional: vectorised paths fall back to plain Python
+    np = None
+
 
 # ---------------------------------------------------------------------------
 # Procedural audio (no external files)
 # ---------------------------------------------------------------------------
 
+# Used for mixer.pre_init in main() (pygame.init() would otherwise open the mixer with its own
+# defaults first, making a later mixer.init a no-op) and for mixer.init in the game.
+# 44.1 kHz stereo as in pygame's default; 1024 samples at 44.1 kHz is about 23 ms of buffer.
+MIXER_SETTINGS = {"frequency": 44100, "size": -16, "channels": 2, "buffer": 1024}
+
+
+# Input events run() never handles (see VanishingMemoriesGame.run)
+IGNORED_EVENT_TYPES = [
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+]
+# The only events run() reads; anything else left in the queue is dropped each frame
+HANDLED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED]
+
+
 def _make_wav_bytes(sample_rate: int, duration_sec: float, generator) -> bytes:
-    """Generate WAV file bytes from a sample generator (yields -1..1 floats)."""
+    """Generate WAV file bytes from a sample generator (returns -1..1 floats).
+
+    The generator is called as generator(t, m), where m is the math namespace to
+    use: numpy with t as the whole time vector when available, else the math
+    module with t as a single sample time.
+    """
     n_samples = int(sample_rate * duration_sec)
-    samples = array("h")
-    for i in range(n_samples):
-        t = i / sample_rate
-        v = generator(t, i, n_samples)
-        v = max(-1.0, min(1.0, v))
-        samples.append(int(v * 32767))
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(sample_rate)
-        wav.writeframes(samples.tobytes())
-    buf.seek(0)
-    return buf.read()
+    if np is not None:
+        t = np.arange(n_samples, dtype=np.float64) / sample_rate
+        v = np.clip(generator(t, np), -1.0, 1.0)
+        pcm = (v * 32767).astype("<i2").tobytes()
+    else:
+        samples = array("h", bytes(2 * n_samples))  # pre-sized; filled by index
+        for i in range(n_samples):
+            v = generator(i / sample_rate, math)
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            samples[i] = int(v * 32767)
+        pcm = samples.tobytes()
+    return _wav_header(sample_rate, len(pcm)) + pcm
+
+
+def _wav_header(sample_rate: int, pcm_len: int) -> bytes:
+    """44-byte RIFF header for mono 16-bit PCM (what wave.Wave_write would emit)."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + pcm_len, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", pcm_len,
+    )
+
+
+# Bump when a generator in _procedural_sounds changes so cached WAVs are rebuilt.
+PROCEDURAL_SOUND_VERSION = "1"
+SOUND_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "truth_half_life")
+
+
+def _cached_wav_bytes(name: str, sample_rate: int, duration_sec: float, generator) -> bytes:
+    """Return WAV bytes for a procedural sound, reusing the copy cached on disk if present.
+
+    A cached file is only used if it is exactly what _make_wav_bytes would write (same header
+    and data length); a truncated or stale file is regenerated and overwritten.
+    """
+    key = hashlib.blake2b(f"{PROCEDURAL_SOUND_VERSION}:{sample_rate}".encode()).hexdigest()[:16]
+    path = os.path.join(SOUND_CACHE_DIR, f"{key}_{name}.wav")
+    pcm_len = 2 * int(sample_rate * duration_sec)
+    try:
+        with open(path, "rb") as f:
+            cached = f.read()
+        if len(cached) == 44 + pcm_len and cached[:44] == _wav_header(sample_rate, pcm_len):
+            return cached
+    except OSError:
+        pass
+    wav_bytes = _make_wav_bytes(sample_rate, duration_sec, generator)
+    try:
+        os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(wav_bytes)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # cache is best-effort (e.g. read-only home); regenerate next launch
+    return wav_bytes
 
 
 def _procedural_sounds() -> dict:
@@ -80,33 +154,32 @@ def _procedural_sounds() -> dict:
     def _load_wav(wav_bytes: bytes):
         return pygame.mixer.Sound(file=io.BytesIO(wav_bytes))
 
-    # Heartbeat: two thumps
-    def heartbeat_gen(t, i, n):
+    # Heartbeat: two thumps (branches as masks so the same code runs on arrays)
+    def heartbeat_gen(t, m):
         period = 0.8
         phase = (t % period) / period
-        if phase < 0.15:
-            return math.exp(-phase * 40) * 0.4 * math.sin(phase * 80)
-        if phase < 0.35:
-            return math.exp(-(phase - 0.2) * 30) * 0.35 * math.sin((phase - 0.2) * 70)
-        return 0.0
+        first = phase < 0.15
+        second = (phase >= 0.15) & (phase < 0.35)
+        return (
+            first * m.exp(-phase * 40) * 0.4 * m.sin(phase * 80)
+            + second * m.exp(-(phase - 0.2) * 30) * 0.35 * m.sin((phase - 0.2) * 70)
+        )
 
-    sounds["heartbeat"] = _load_wav(_make_wav_bytes(sr, 0.9, heartbeat_gen))
+    sounds["heartbeat"] = _load_wav(_cached_wav_bytes("heartbeat", sr, 0.9, heartbeat_gen))
     sounds["heartbeat"].set_volume(0.25)
 
     # Snapshot: short low beep
-    def beep_gen(t, i, n):
-        if t > 0.12:
-            return 0.0
-        return 0.3 * math.sin(2 * math.pi * 440 * t) * math.exp(-t * 15)
+    def beep_gen(t, m):
+        return (t <= 0.12) * 0.3 * m.sin(2 * m.pi * 440 * t) * m.exp(-t * 15)
 
-    sounds["snapshot"] = _load_wav(_make_wav_bytes(sr, 0.2, beep_gen))
+    sounds["snapshot"] = _load_wav(_cached_wav_bytes("snapshot", sr, 0.2, beep_gen))
     sounds["snapshot"].set_volume(0.4)
 
     # Ominous low tone (loopable)
-    def ominous_gen(t, i, n):
-        return 0.12 * math.sin(2 * math.pi * 55 * t) * (0.7 + 0.3 * math.sin(0.5 * t))
+    def ominous_gen(t, m):
+        return 0.12 * m.sin(2 * m.pi * 55 * t) * (0.7 + 0.3 * m.sin(0.5 * t))
 
-    sounds["ominous"] = _load_wav(_make_wav_bytes(sr, 2.0, ominous_gen))
+    sounds["ominous"] = _load_wav(_cached_wav_bytes("ominous", sr, 2.0, ominous_gen))
     sounds["ominous"].set_volume(0.2)
 
     return sounds
@@ -116,16 +189,35 @@ def _procedural_sounds() -> dict:
 # Easing and animation helpers
 # ---------------------------------------------------------------------------
 
+EASE_STEPS = 1024  # easing inputs in [0, 1] are memoised at this resolution
+
+
+def _quantized_easing(fn):
+    """Memoise an easing curve on t quantised to 1/EASE_STEPS; out-of-range t is exact."""
+    cached = functools.lru_cache(maxsize=4096)(lambda step: fn(step / EASE_STEPS))
+
+    @functools.wraps(fn)
+    def wrapper(t: float) -> float:
+        if 0.0 <= t <= 1.0:
+            return cached(int(t * EASE_STEPS))
+        return fn(t)
+
+    return wrapper
+
+
+@_quantized_easing
 def ease_out_quad(t: float) -> float:
     return 1.0 - (1.0 - t) ** 2
 
 
+@_quantized_easing
 def ease_in_out_cubic(t: float) -> float:
     if t < 0.5:
         return 4 * t * t * t
     return 1 - (-2 * t + 2) ** 3 / 2
 
 
+@_quantized_easing
 def ease_out_elastic(t: float) -> float:
     if t <= 0 or t >= 1:
         return t
@@ -133,11 +225,36 @@ def ease_out_elastic(t: float) -> float:
     return 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * c4) + 1
 
 
+def advance_typing(acc: float, idx: int, dt: float, cps: float, n: int) -> Tuple[float, int]:
+    """Typewriter step: add dt*cps to the fractional-char accumulator and reveal whole chars (max n)."""
+    acc += dt * cps
+    if acc >= 1.0 and idx < n:
+        steps = min(int(acc), n - idx)
+        idx += steps
+        acc -= steps
+    if idx >= n:
+        acc = 0.0
+    return acc, idx
+
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
+class ArtifactSpec:
+    """Placement of one artifact in a scene, before its image is loaded (see SCENE_ARTIFACT_SPECS)."""
+    filename: str
+    frac_x: float
+    frac_y: float
+    rotation_degrees: float
+    darken: float
+    scale: float = 1.0  # max_side is 80 * scale
+    offset_x_aw: float = 0.0
+    offset_y_ah: float = 0.0
+
+
+@dataclass(slots=True)
 class SceneArtifact:
     """One artifact image placed in a scene (position as fraction of background image)."""
     surface: pygame.Surface
@@ -151,14 +268,41 @@ class SceneArtifact:
     spec_filename: str = ""  # e.g. "q10-1.png" or "r3.png" for popup name/description lookup
     suspect_id: str = ""  # "queen" | "chef" | "goblin" for evidence scoring
     points: int = 0  # evidence points toward that suspect (0 for replacements)
+    display_surface: pygame.Surface = field(init=False)  # surface with darken baked in (drawn each frame)
+    highlight_surface: pygame.Surface | None = field(init=False, default=None)  # hover lighten layer, made on first hover
+
+    def __post_init__(self) -> None:
+        if self.darken < 1.0:
+            sw, sh = self.surface.get_width(), self.surface.get_height()
+            temp = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            temp.blit(self.surface, (0, 0))
+            dark = pygame.Surface((sw, sh))
+            v = int(255 * self.darken)
+            dark.fill((v, v, v))
+            temp.blit(dark, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self.display_surface = temp
+        else:
+            self.display_surface = self.surface
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryScene:
     label: str
-    background: pygame.Surface
+    background: pygame.Surface | None  # None until VanishingMemoriesGame._load_scene decodes it
     bg_rect: Tuple[int, int, int, int]  # (ox, oy, w, h) of image area in scene
     artifacts: List[SceneArtifact]
+    artifact_rects: List[pygame.Rect] = field(init=False, default_factory=list)  # unshaken, parallel to artifacts
+    artifact_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = field(init=False, default_factory=list)  # unshaken (display_surface, topleft)
+    blurred: Tuple[Tuple[int, int], pygame.Surface] | None = field(init=False, default=None, repr=False)  # (downscale size, blurred background)
+
+    def __post_init__(self) -> None:
+        ox, oy, bw, bh = self.bg_rect
+        for art in self.artifacts:
+            sw, sh = art.surface.get_width(), art.surface.get_height()
+            dx = ox + int(art.frac_x * bw) - sw // 2 + int(art.offset_x_aw * sw)
+            dy = oy + int(art.frac_y * bh) - sh // 2 + int(art.offset_y_ah * sh)
+            self.artifact_rects.append(pygame.Rect(dx, dy, sw, sh))
+            self.artifact_blits.append((art.display_surface, (dx, dy)))
 
 
 # Artifact popup: display name and description keyed by spec filename (e.g. "q10-1.png")
@@ -267,6 +411,13 @@ REPLACEMENT_MAP: dict = {
     (5, "g10-2.png"): "r12.png",
 }
 
+# Freeze both tables as read-only views with interned filename keys; _load_scene interns
+# the filenames it looks up (and stores on SceneArtifact), so lookups compare by identity.
+ARTIFACT_INFO = MappingProxyType({sys.intern(k): v for k, v in ARTIFACT_INFO.items()})
+REPLACEMENT_MAP = MappingProxyType(
+    {(i, sys.intern(name)): sys.intern(repl) for (i, name), repl in REPLACEMENT_MAP.items()}
+)
+
 EVIDENCE_POINTS_REQUIRED = 12
 
 # Opening cutscene text: one list per slide (game_op1 .. game_op7), each a list of text boxes.
@@ -476,25 +627,42 @@ GOOD_ENDING_GE2_CORONATION: List[str] = [
 ]
 
 
+# Suspect letter plus leading point digits; replacements (r1.png, ...) never match
+_ARTIFACT_RE = re.compile(r"([qcg])(\d*)")
+_SUSPECT_BY_LETTER = {"q": "queen", "c": "chef", "g": "goblin"}
+
+
+@functools.lru_cache(maxsize=None)
 def _parse_artifact_suspect_and_points(filename: str) -> Tuple[str, int]:
     """From artifact filename (e.g. q10-1.png, c5-2.png) return (suspect_id, points). r1.png -> ("", 0)."""
-    base = filename.lower().replace(".png", "")
-    if base.startswith("r") and base[1:].isdigit():
-        return ("", 0)
-    if not base or base[0] not in ("q", "c", "g"):
+    m = _ARTIFACT_RE.match(filename.lower().replace(".png", ""))
+    if m is None:
         return ("", 0)
-    suspect = {"q": "queen", "c": "chef", "g": "goblin"}[base[0]]
-    num_str = ""
-    for c in base[1:]:
-        if c.isdigit():
-            num_str += c
-        else:
-            break
-    points = int(num_str) if num_str else 0
-    return (suspect, points)
+    return (_SUSPECT_BY_LETTER[m[1]], int(m[2]) if m[2] else 0)
 
 
-@dataclass
+# killer_id -> REPLACEMENT_MAP restricted to the entries that apply when that suspect is the killer
+REPLACEMENT_BY_KILLER = MappingProxyType({
+    killer_id: MappingProxyType({
+        key: repl for key, repl in REPLACEMENT_MAP.items()
+        if _parse_artifact_suspect_and_points(key[1])[0] != killer_id
+        and _parse_artifact_suspect_and_points(key[1])[1] in (5, 10)
+    })
+    for killer_id in _SUSPECT_BY_LETTER.values()
+})
+
+
+@dataclass(slots=True)
+class EndingSlide:
+    """One ending slide: an end_scene image plus the script text boxes typed over it."""
+    image: str
+    script: List[str] = field(default_factory=list)
+    show_memories: bool = False  # row of crystallized snapshots (clickable polaroids)
+    accept_123: bool = False  # wait for 1/2/3 (goblin/chef/queen) instead of RIGHT ARROW
+    exit_prompt: bool = False  # last slide: once the script is shown, any key or click quits
+
+
+@dataclass(slots=True)
 class Snapshot:
     surface: pygame.Surface
     tags: List[str]
@@ -503,9 +671,10 @@ class Snapshot:
     points_chef: int = 0
     points_goblin: int = 0
     trigger_artifact_filename: str | None = None  # artifact popup that triggered this snapshot, or None if via keyboard S
+    polaroids: dict = field(default_factory=dict, repr=False)  # (frame size, thumb size, tilt) -> polaroid layers
 
 
-@dataclass
+@dataclass(slots=True)
 class Suspect:
     id: str
     name: str
@@ -515,47 +684,230 @@ class Suspect:
     flavour: str
 
 
+# ---------------------------------------------------------------------------
+# Fonts
+# ---------------------------------------------------------------------------
+
+# Serif faces for the medieval popup, in preference order (SysFont takes the first installed one)
+SERIF_FONT_NAMES = "timesnewroman,times new roman,georgia,serif"
+# (name, size, bold) -> pygame.font.Font
+_FONT_CACHE: dict = {}
+
+
+def sysfont(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """pygame.font.SysFont, looked up once per (name, size, bold) and shared afterwards."""
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+# ---------------------------------------------------------------------------
+# Image loading
+# ---------------------------------------------------------------------------
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Script may be in project root or inside end_scene; images live in end_scene/
+_END_DIR = os.path.join(_ROOT, "end_scene") if os.path.basename(_ROOT) != "end_scene" else _ROOT
+_SCENES_DIR = os.path.join(_ROOT, "scenes")
+_MENU_DIR = os.path.join(_ROOT, "menu_pics")
+_OPEN_DIR = os.path.join(_ROOT, "open_scene")
+_REPL_DIR = os.path.join(_ROOT, "replacements")
+
+# (abs path, size, fit, max_side, scale, rotation, alpha, smooth) -> decoded, scaled surface
+_IMAGE_CACHE: dict = {}
+# abs path -> Future of a raw pygame.image.load started by prefetch_images
+_PENDING_DECODES: dict = {}
+_decode_pool: ThreadPoolExecutor | None = None
+# [abs path, surface] of the latest decode, so scaling the same file to a second size skips the disk
+_LAST_DECODE: list = [None, None]
+
+
+def prefetch_images(paths: List[str]) -> None:
+    """Start decoding images on worker threads; load_scaled picks the results up.
+
+    Only the file decode runs off the main thread (it releases the GIL); convert,
+    scaling and rotation stay on the main thread since SDL surfaces are not thread-safe.
+    """
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="decode")
+    loaded = {cache_key[0] for cache_key in _IMAGE_CACHE}
+    for path in paths:
+        key = os.path.abspath(path)
+        if key not in _PENDING_DECODES and key not in loaded:
+            _PENDING_DECODES[key] = _decode_pool.submit(pygame.image.load, key)
+
+
+def cancel_prefetch() -> None:
+    """Drop queued decodes and wait for running ones, and forget the latest decode (call before pygame.quit)."""
+    global _decode_pool
+    if _decode_pool is not None:
+        _decode_pool.shutdown(wait=True, cancel_futures=True)
+        _decode_pool = None
+    _PENDING_DECODES.clear()
+    _LAST_DECODE[:] = [None, None]
+
+
+def _decode_image(path: str) -> pygame.Surface:
+    """pygame.image.load, reusing a prefetched decode if one was started for path (or the latest decode)."""
+    key = os.path.abspath(path)
+    if _LAST_DECODE[0] == key:
+        return _LAST_DECODE[1]
+    future: Future | None = _PENDING_DECODES.pop(key, None)
+    if future is not None and not future.cancelled():
+        img = future.result()  # re-raises the worker's pygame.error / FileNotFoundError
+    else:
+        img = pygame.image.load(path)
+    _LAST_DECODE[:] = [key, img]
+    return img
+
+
+def load_scaled(
+    path: str,
+    size: Tuple[int, int] | None = None,
+    *,
+    fit: Tuple[int, int] | None = None,
+    max_side: int | None = None,
+    scale: float | None = None,
+    rotation: float = 0,
+    alpha: bool | None = True,
+    smooth: bool = True,
+) -> pygame.Surface:
+    """Load an image, smoothscale it and optionally rotate it; cached per arguments.
+
+    Give exactly one target: size (exact w, h), fit (largest aspect-preserving size inside
+    w, h), max_side (cap the longer side, never upscale) or scale (factor). alpha picks
+    convert_alpha() over convert(); None keeps per-pixel alpha only if the file has it, so
+    opaque backgrounds get the plain opaque blit. smooth=False lets full-screen backgrounds that are only
+    being shrunk use the much cheaper nearest-neighbour scale; upscales always stay smooth.
+    Raises pygame.error / FileNotFoundError like image.load.
+    Returned surfaces are shared: blit or copy them, do not draw on them.
+    """
+    key = (os.path.abspath(path), size, fit, max_side, scale, rotation, alpha, smooth)
+    surf = _IMAGE_CACHE.get(key)
+    if surf is not None:
+        return surf
+    img = _decode_image(path)
+    if alpha is None:
+        alpha = bool(img.get_flags() & pygame.SRCALPHA)
+    img = img.convert_alpha() if alpha else img.convert()
+    iw, ih = img.get_width(), img.get_height()
+    if size is not None:
+        w, h = size
+    elif fit is not None:
+        s = min(fit[0] / iw, fit[1] / ih)
+        w, h = max(1, int(iw * s)), max(1, int(ih * s))
+    elif max_side is not None:
+        w, h = iw, ih
+        if w > h:
+            if w > max_side:
+                h = max(1, int(h * max_side / w))
+                w = max_side
+        elif h > max_side:
+            w = max(1, int(w * max_side / h))
+            h = max_side
+    else:
+        w, h = max(1, int(iw * scale)), max(1, int(ih * scale))
+    if (w, h) == (iw, ih):
+        surf = img  # already the target size (e.g. max_side above both sides): skip the resample pass
+    elif smooth or w > iw or h > ih:
+        surf = pygame.transform.smoothscale(img, (w, h))
+    else:
+        surf = pygame.transform.scale(img, (w, h))
+    if rotation:
+        surf = pygame.transform.rotate(surf, rotation)
+    _IMAGE_CACHE[key] = surf
+    return surf
+
+
 # ---------------------------------------------------------------------------
 # Reusable draw helpers (procedural only)
 # ---------------------------------------------------------------------------
 
-def draw_vignette(surface: pygame.Surface, intensity: float = 0.6) -> None:
-    """Darken screen edges with a soft vignette."""
-    w, h = surface.get_size()
-    cx, cy = w / 2, h / 2
-    max_d = math.sqrt(cx * cx + cy * cy)
-    for y in range(0, h, 4):
-        for x in range(0, w, 4):
-            d = math.sqrt((x - cx) ** 2 + (y - cy) ** 2) / max_d
-            v = min(1.0, intensity * ease_out_quad(d))
-            rect = pygame.Rect(x, y, 4, 4)
-            s = surface.subsurface(rect).copy()
-            s.fill((0, 0, 0, int(40 * v)))
-            surface.blit(s, (x, y), special_flags=pygame.BLEND_RGBA_SUB)
-    # Faster approximate: radial gradient overlay
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    for radius in range(max(w, h) // 2, 0, -30):
-        alpha = int(intensity * 80 * (1 - radius / (max(w, h) / 2)) ** 1.5)
-        if alpha <= 0:
-            break
-        pygame.draw.circle(overlay, (0, 0, 0, min(255, alpha)), (int(cx), int(cy)), radius)
-    surface.blit(overlay, (0, 0))
+# (w, h, intensity) -> pre-drawn gradient for draw_vignette_fast
+_VIGNETTE_FAST_CACHE: dict = {}
 
 
 def draw_vignette_fast(surface: pygame.Surface, intensity: float = 0.5) -> None:
     """Faster vignette using a pre-drawn gradient."""
     w, h = surface.get_size()
-    cx, cy = w // 2, h // 2
-    r = max(w, h)
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    steps = 8
-    for i in range(steps, 0, -1):
-        radius = r * (i / steps)
-        alpha = int(intensity * 100 * (1 - (i / steps) ** 0.7))
-        pygame.draw.circle(overlay, (0, 0, 0, min(255, alpha)), (cx, cy), int(radius))
+    overlay = _VIGNETTE_FAST_CACHE.get((w, h, intensity))
+    if overlay is None:
+        cx, cy = w // 2, h // 2
+        r = max(w, h)
+        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+        steps = 8
+        for i in range(steps, 0, -1):
+            radius = r * (i / steps)
+            alpha = int(intensity * 100 * (1 - (i / steps) ** 0.7))
+            pygame.draw.circle(overlay, (0, 0, 0, min(255, alpha)), (cx, cy), int(radius))
+        _VIGNETTE_FAST_CACHE[(w, h, intensity)] = overlay
     surface.blit(overlay, (0, 0))
 
 
+def draw_vignette(surface: pygame.Surface, intensity: float = 0.6) -> None:
+    """Darken screen edges with a soft vignette (the pre-drawn gradient of draw_vignette_fast)."""
+    draw_vignette_fast(surface, intensity)
+
+
+# (size, color) -> solid SRCALPHA overlay reused across frames by _overlay_surface
+_OVERLAY_SURFACES: dict = {}
+
+
+def _overlay_surface(size: Tuple[int, int], color: Tuple[int, ...], alpha: int | None = None) -> pygame.Surface:
+    """Cached surface filled with color; alpha (if given) is applied as surface alpha.
+
+    Callers only blit the result, never draw on it. A per-frame alpha on an opaque
+    fill blends identically to filling with that alpha, without a cache entry per value.
+    """
+    key = (size, color)
+    surf = _OVERLAY_SURFACES.get(key)
+    if surf is None:
+        surf = _OVERLAY_SURFACES[key] = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(color)
+    surf.set_alpha(255 if alpha is None else alpha)
+    return surf
+
+
+# pygame-ce's fblits skips per-item rect/flag unpacking; plain pygame falls back to blits
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+GLOW_PULSE_STEPS = 16  # pulse quantisation for cached glow sprites
+
+
+@functools.lru_cache(maxsize=512)
+def _build_glow_sprite(
+    radius: int,
+    base_color: Tuple[int, int, int],
+    pulse_step: int,
+    glow_radius_extra: float,
+) -> pygame.Surface:
+    """Render draw_glowing_circle's glow layers, ring and inner fill into one sprite."""
+    pulse = pulse_step / GLOW_PULSE_STEPS
+    size = radius * 2 + int(glow_radius_extra) * 4
+    c = size // 2
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    # One scratch surface, cleared per layer; each layer uses its top-left (n x n) area
+    scratch = pygame.Surface((size, size), pygame.SRCALPHA)
+    # Outer glow layers
+    for r_off in range(int(glow_radius_extra), 0, -3):
+        alpha = int(40 * (1 - r_off / (glow_radius_extra + 1)) * (0.8 + 0.2 * pulse))
+        n = radius * 2 + r_off * 4
+        scratch.fill((0, 0, 0, 0))
+        pygame.draw.circle(scratch, (*base_color, alpha), (n // 2, n // 2), radius + r_off)
+        sprite.blit(scratch, (c - n // 2, c - n // 2), (0, 0, n, n))
+    # Main ring
+    ring_thick = max(3, int(4 + pulse * 2))
+    pygame.draw.circle(sprite, base_color, (c, c), radius, ring_thick)
+    # Inner dim fill
+    scratch.fill((0, 0, 0, 0))
+    pygame.draw.circle(scratch, (*base_color, 30), (radius, radius), radius - 4)
+    sprite.blit(scratch, (c - radius, c - radius), (0, 0, radius * 2, radius * 2))
+    return sprite
+
+
 def draw_glowing_circle(
     surface: pygame.Surface,
     center: Tuple[float, float],
@@ -564,36 +916,38 @@ def draw_glowing_circle(
     pulse: float,
     glow_radius_extra: float = 15,
 ) -> None:
-    """Draw a circle with animated outer glow and pulse."""
+    """Draw a circle with animated outer glow and pulse (one blit of a cached sprite)."""
     cx, cy = int(center[0]), int(center[1])
-    # Outer glow layers
-    for r_off in range(int(glow_radius_extra), 0, -3):
-        alpha = int(40 * (1 - r_off / (glow_radius_extra + 1)) * (0.8 + 0.2 * pulse))
-        s = pygame.Surface((radius * 2 + r_off * 4, radius * 2 + r_off * 4), pygame.SRCALPHA)
-        pygame.draw.circle(
-            s, (*base_color, alpha),
-            (s.get_width() // 2, s.get_height() // 2),
-            int(radius + r_off),
-        )
-        surface.blit(s, (cx - s.get_width() // 2, cy - s.get_height() // 2))
-    # Main ring
-    ring_thick = max(3, int(4 + pulse * 2))
-    pygame.draw.circle(surface, base_color, (cx, cy), int(radius), ring_thick)
-    # Inner dim fill
-    inner = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-    pygame.draw.circle(inner, (*base_color, 30), (int(radius), int(radius)), int(radius) - 4)
-    surface.blit(inner, (cx - radius, cy - radius))
+    sprite = _build_glow_sprite(
+        int(radius), tuple(base_color), int(pulse * GLOW_PULSE_STEPS), glow_radius_extra,
+    )
+    surface.blit(sprite, (cx - sprite.get_width() // 2, cy - sprite.get_height() // 2))
+
+
+# (w, h) -> (1-px scanline alpha column, full-size scanline mask) for draw_glitch_overlay
+_SCANLINE_SURFACES: dict = {}
 
 
 def draw_glitch_overlay(surface: pygame.Surface, amount: float, time: float) -> None:
     """Subtle scanline and horizontal shift glitch."""
     w, h = surface.get_size()
-    # Scanlines
-    scan = pygame.Surface((w, h), pygame.SRCALPHA)
-    for y in range(0, h, 4):
-        a = int(8 * amount * (0.5 + 0.5 * math.sin(time * 3 + y * 0.02)))
-        pygame.draw.line(scan, (0, 0, 0, a), (0, y), (w, y))
-    surface.blit(scan, (0, 0))
+    # Scanlines: alpha never reaches 1 below amount 1/8, so there is nothing to draw
+    if 8 * amount >= 1:
+        cached = _SCANLINE_SURFACES.get((w, h))
+        if cached is None:
+            cached = (pygame.Surface((1, h), pygame.SRCALPHA), pygame.Surface((w, h), pygame.SRCALPHA))
+            _SCANLINE_SURFACES[(w, h)] = cached
+        column, scan = cached
+        # Per-row alphas go into a 1-px column that is stretched (nearest) across the width
+        if np is not None:
+            ys = np.arange(0, h, 4, dtype=np.float64)
+            alphas = (8 * amount * (0.5 + 0.5 * np.sin(time * 3 + ys * 0.02))).astype(np.uint8)
+            pygame.surfarray.pixels_alpha(column)[0, ::4] = alphas
+        else:
+            for y in range(0, h, 4):
+                column.set_at((0, y), (0, 0, 0, int(8 * amount * (0.5 + 0.5 * math.sin(time * 3 + y * 0.02)))))
+        pygame.transform.scale(column, (w, h), scan)
+        surface.blit(scan, (0, 0))
     # Occasional horizontal slice shift
     if amount > 0.3 and random.random() < 0.02:
         slice_h = random.randint(2, 15)
@@ -612,43 +966,110 @@ def draw_polaroid_frame(
     shadow_offset: Tuple[int, int] = (6, 6),
 ) -> None:
     """Draw an image in a polaroid-style frame with shadow and tilt."""
+    blit_polaroid(surface, rect, render_polaroid(rect.size, image, tilt), tilt, shadow_offset)
+
+
+def render_polaroid(
+    size: Tuple[int, int],
+    image: pygame.Surface,
+    tilt: float = 0.0,
+) -> Tuple[pygame.Surface, pygame.Surface]:
+    """Build the (shadow, frame) layers of a polaroid of the given size; blit with blit_polaroid."""
+    w, h = size
     border = 10
     # Shadow
-    shadow_surf = pygame.Surface((rect.w + 20, rect.h + 20), pygame.SRCALPHA)
+    shadow_surf = pygame.Surface((w + 20, h + 20), pygame.SRCALPHA)
     pygame.draw.rect(
         shadow_surf, (0, 0, 0, 80),
-        (10, 10, rect.w, rect.h), border_radius=4,
+        (10, 10, w, h), border_radius=4,
     )
     if abs(tilt) > 0.01:
         shadow_surf = pygame.transform.rotate(shadow_surf, tilt * 0.5)
-    shadow_pos = (rect.x - 10 + shadow_offset[0], rect.y - 10 + shadow_offset[1])
-    surface.blit(shadow_surf, shadow_pos)
     # White border frame (polaroid)
-    frame_surf = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-    pygame.draw.rect(frame_surf, (255, 255, 255, 255), (0, 0, rect.w, rect.h), border_radius=3)
-    img_inner = pygame.Rect(border, border, rect.w - 2 * border, rect.h - 2 * border)
+    frame_surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(frame_surf, (255, 255, 255, 255), (0, 0, w, h), border_radius=3)
+    img_inner = pygame.Rect(border, border, w - 2 * border, h - 2 * border)
     scaled = pygame.transform.smoothscale(image, img_inner.size)
     frame_surf.blit(scaled, (border, border))
     if abs(tilt) > 0.01:
         frame_surf = pygame.transform.rotate(frame_surf, tilt)
-        frame_rect = frame_surf.get_rect(center=rect.center)
-        surface.blit(frame_surf, frame_rect.topleft)
-    else:
-        surface.blit(frame_surf, (rect.x, rect.y))
+    return shadow_surf, frame_surf
+
+
+def blit_polaroid(
+    surface: pygame.Surface,
+    rect: pygame.Rect,
+    layers: Tuple[pygame.Surface, pygame.Surface],
+    tilt: float = 0.0,
+    shadow_offset: Tuple[int, int] = (6, 6),
+) -> None:
+    """Blit layers from render_polaroid so the frame sits at rect."""
+    surface.blits(polaroid_blits(rect, layers, tilt, shadow_offset), doreturn=False)
+
+
+def polaroid_blits(
+    rect: pygame.Rect,
+    layers: Tuple[pygame.Surface, pygame.Surface],
+    tilt: float = 0.0,
+    shadow_offset: Tuple[int, int] = (6, 6),
+) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+    """(surface, pos) pairs for blit_polaroid, shadow first, for batching several polaroids."""
+    shadow_surf, frame_surf = layers
+    shadow_pos = (rect.x - 10 + shadow_offset[0], rect.y - 10 + shadow_offset[1])
+    if abs(tilt) > 0.01:
+        return [(shadow_surf, shadow_pos), (frame_surf, frame_surf.get_rect(center=rect.center).topleft)]
+    return [(shadow_surf, shadow_pos), (frame_surf, (rect.x, rect.y))]
+
+
+# (w, h) -> reusable SRCALPHA surface for draw_noise_texture
+_NOISE_SURFACES: dict = {}
+# Private generator for the pure-Python noise path, so reseeding per frame leaves the
+# global random module (culprit choice, glitch slices) untouched
+_noise_rng = random.Random()
 
 
 def draw_noise_texture(surface: pygame.Surface, alpha: int, time: float) -> None:
     """Subtle animated noise overlay."""
     w, h = surface.get_size()
-    noise = pygame.Surface((w, h), pygame.SRCALPHA)
-    random.seed(int(time * 10) % 100000)
-    for _ in range(min(2000, w * h // 50)):
-        x, y = random.randint(0, w - 1), random.randint(0, h - 1)
-        v = random.randint(0, alpha)
-        noise.set_at((x, y), (255, 255, 255, v))
+    noise = _NOISE_SURFACES.get((w, h))
+    if noise is None:
+        noise = _NOISE_SURFACES[(w, h)] = pygame.Surface((w, h), pygame.SRCALPHA)
+    noise.fill((0, 0, 0, 0))
+    count = min(2000, w * h // 50)
+    if np is not None:
+        # Scatter all specks with two array writes instead of per-pixel set_at
+        rng = np.random.default_rng(int(time * 10) % 100000)
+        xs = rng.integers(0, w, count)
+        ys = rng.integers(0, h, count)
+        pygame.surfarray.pixels3d(noise)[xs, ys] = 255
+        pygame.surfarray.pixels_alpha(noise)[xs, ys] = rng.integers(0, alpha + 1, count)
+    else:
+        _noise_rng.seed(int(time * 10) % 100000)
+        randint = _noise_rng.randint
+        for _ in range(count):
+            x, y = randint(0, w - 1), randint(0, h - 1)
+            v = randint(0, alpha)
+            noise.set_at((x, y), (255, 255, 255, v))
     surface.blit(noise, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
 
+# (w, h, count, color, variant) -> transparent surface with scattered opaque specks
+_SPECK_SURFACES: dict = {}
+
+
+def speck_texture(size: Tuple[int, int], count: int, color: Tuple[int, int, int], variant: int = 0) -> pygame.Surface:
+    """Paper-grain overlay: count single-pixel specks of color, fixed per variant. Shared: do not draw on it."""
+    key = (size, count, color, variant)
+    specks = _SPECK_SURFACES.get(key)
+    if specks is None:
+        w, h = size
+        specks = _SPECK_SURFACES[key] = pygame.Surface((w, h), pygame.SRCALPHA)
+        rng = random.Random(variant)
+        for _ in range(count):
+            specks.set_at((rng.randint(0, w - 1), rng.randint(0, h - 1)), color)
+    return specks
+
+
 # ---------------------------------------------------------------------------
 # Game
 # ---------------------------------------------------------------------------
@@ -657,13 +1078,40 @@ class VanishingMemoriesGame:
     WIDTH = 1100
     HEIGHT = 700
     FPS = 60
+    MENU_FPS = 30  # menu only moves with the timer bar and hover
+    IDLE_FPS = 20  # opening/ending slide fully typed out, waiting for input
     GLOBAL_TIME_LIMIT = 120.0  # 2 minutes; timer never pauses (runs in menu and in scene)
     MAX_SNAPSHOTS = 3
+    TEXT_CACHE_SIZE = 512
+    BLUR_STEPS = 32  # fade blur strength levels; the blurred background is only rebuilt when the level changes
+    SHAKE_JITTER_SIZE = 1024  # power of two; ~17 s of shake at 60 fps before the jitter repeats
+    GRAIN_FRAMES = 4  # pre-baked paper-grain patterns per accuse card, cycled at GRAIN_FPS
+    GRAIN_FPS = 12
+    SCRIPT_TEXT_COLOR = (232, 225, 210)  # opening/ending script box: dialogue, drop shadow, speaker
+    SCRIPT_SHADOW_COLOR = (40, 35, 30)
+    SCRIPT_SPEAKER_COLOR = (180, 168, 145)
     CLOCK_RADIUS = 52
     SCENE_HEIGHT = int(700 * 0.72)
     # Clock grid: 3 columns, 2 rows, centered on screen
     CLOCK_SPACING = 200
     CLOCK_GRID_TOP = 260
+    # Fallback clock face colour by (time_up << 1) | hover: idle, hovered, time up (hover ignored)
+    CLOCK_COLORS = ((80, 130, 190), (100, 160, 220), (60, 70, 90), (60, 70, 90))
+    # Scenes: clock label per scene, artifact placement and snapshot tags (see _load_scene)
+    SCENE_LABELS = ["09:12", "11:17", "12:03", "14:40", "18:22", "21:10"]
+    # (filename, frac_x, frac_y, rotation_deg, darken [, scale [, offset_x_aw [, offset_y_ah ]]]) -> ArtifactSpec
+    SCENE_ARTIFACT_SPECS = [[ArtifactSpec(*spec) for spec in specs] for specs in [
+        [("q1-1.png", 0.92, 0.5 + 1 / 8 + 0.08, 0, 0.48), ("c1-1.png", 1 / 16, 0.5, 0, 1.0, 0.75), ("g1-1.png", 0.45, 0.5, 0, 1.0, 1 / 3, 1.0, 0)],
+        [("q5-2.png", 0.4, 0.5 + 3 / 16, 8, 1.0), ("c10-1.png", 0.42, 0.5, 0, 0.6, 1.0, 1.0, 0), ("g1-2.png", 5 / 6, 0.25, 0, 1.0, 2 / 3, -0.25, 0)],
+        [("q5-1.png", 7 / 8, 7 / 8, 0, 0.35), ("c1-2.png", 0.45, 0.52, 0, 1.0, 1 / 3), ("g5-1.png", 3 / 4, 0.5, 0, 1.0, 0.5, 0.5, 0.25)],
+        [("q10-2.png", 1 / 8, 7 / 8, 0, 0.35), ("c5-1.png", 1.0, 2 / 3, 0, 0.35, 2 / 3, -0.5, 0), ("g5-2.png", 3 / 8, 0.52, 0, 1.0)],
+        [("q10-1.png", 0.92, 0.5 - 1 / 16, 0, 1.0), ("c5-2.png", 0.25, 0.98, 0, 0.6, 2.0, 0.5, 0), ("g10-1.png", 1 / 4, 0.48, 0, 0.85, 1.0, -0.25, -1.0)],
+        [("q1-2.png", 0.93, 0.58, 0, 0.4), ("c10-2.png", 1 / 3, 1 / 3 - 0.06, 0, 0.35, 1.2, 0.5, 1.0), ("g10-2.png", 1 / 4, 0.5, 0, 0.5, 2 / 3, 0, -1 / 6)],
+    ]]
+    SCENE_TAG_OPTIONS = [
+        ["dna", "time", "access"], ["jealousy", "relationship", "motive"], ["workshop", "insider", "struggle"],
+        ["digital", "lure", "premeditation"], ["poison", "escape", "alibi_break"], ["entry", "forensics", "tools"],
+    ]
 
     def __init__(self, screen: pygame.Surface) -> None:
         self.screen = screen
@@ -673,10 +1121,9 @@ class VanishingMemoriesGame:
 
         # Procedural sounds and background music (Yakov Golman, Free Music Archive, CC BY)
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=512)
+            pygame.mixer.init(**MIXER_SETTINGS)
             self.sounds = _procedural_sounds()
-            root = os.path.dirname(os.path.abspath(__file__))
-            music_path = os.path.join(root, "background_track.mp3")
+            music_path = os.path.join(_ROOT, "background_track.mp3")
             if os.path.isfile(music_path):
                 pygame.mixer.music.load(music_path)
                 pygame.mixer.music.set_volume(0.5)
@@ -685,39 +1132,63 @@ class VanishingMemoriesGame:
             self.sounds = {}
 
         # Fonts (use defaults if no nice font)
-        self.title_font = pygame.font.SysFont("arial", 42, bold=True)
-        self.text_font = pygame.font.SysFont("arial", 20)
-        self.small_font = pygame.font.SysFont("arial", 16)
-        self.big_result_font = pygame.font.SysFont("arial", 64, bold=True)
+        self.title_font = sysfont("arial", 42, bold=True)
+        self.text_font = sysfont("arial", 20)
+        self.small_font = sysfont("arial", 16)
+        self.big_result_font = sysfont("arial", 64, bold=True)
+        self.credit_font = sysfont("arial", 11)
+        # (font, text, color) -> rendered surface, bounded LRU (see _render_text)
+        self._text_cache: dict = {}
+        self._case_closed_title: pygame.Surface | None = None  # draw_result title, own copy as its alpha changes
+        # full script line -> word-wrapped layout with per-char x offsets (see _script_layout)
+        self._script_layouts: dict = {}
+        # (font, max_width, text) -> word-wrapped lines (see _wrap_text)
+        self._wrap_cache: dict = {}
+        # wrapped text block arguments -> (surface, pos) pairs (see _text_block_blits)
+        self._text_blocks: dict = {}
+        # (w, h) -> bordered translucent script box panel (see _script_panel)
+        self._script_panels: dict = {}
         # Medieval popup: serif font if available (Times, Georgia, or system serif)
-        for name in ("timesnewroman", "times new roman", "georgia", "serif"):
-            try:
-                self.popup_title_font = pygame.font.SysFont(name, 22, bold=True)
-                self.popup_text_font = pygame.font.SysFont(name, 18)
-                self.popup_small_font = pygame.font.SysFont(name, 15)
-                break
-            except Exception:
-                continue
-        else:
+        try:
+            self.popup_title_font = sysfont(SERIF_FONT_NAMES, 22, bold=True)
+            self.popup_text_font = sysfont(SERIF_FONT_NAMES, 18)
+            self.popup_small_font = sysfont(SERIF_FONT_NAMES, 15)
+        except Exception:
             self.popup_title_font = self.text_font
             self.popup_text_font = self.text_font
             self.popup_small_font = self.small_font
+        # Line heights used every frame by the popup descriptions and the script box
+        self._popup_line_height = self.popup_text_font.get_height() + 3
+        self._script_text_height = self.popup_text_font.get_height()
+        self._script_speaker_height = self.popup_small_font.get_height()
 
         self.suspects = self._build_suspects()
         self.culprit = random.choice(self.suspects)
-        self.scenes = self._build_scenes(self.culprit.id)
+        # (scene index, displayed artifact filename) -> image path (see _artifact_path)
+        self._artifact_paths: dict = {}
+        self.scenes = self._build_scenes()
 
         self.state = "opening"
         self.global_time = self.GLOBAL_TIME_LIMIT
         self.current_scene_index = -1
         self.snapshots: List[Snapshot] = []
+        self._snapshots_by_label: dict = {}  # scene label -> that scene's snapshots, oldest first
+        self._totals: dict = {"queen": 0, "chef": 0, "goblin": 0}  # running evidence points per suspect
         self.selected_suspect: Suspect | None = None
         self.result_message: str | None = None
         self.result_success: bool = False
+        self._cursors: dict = {}  # SYSTEM_CURSOR_* -> pygame.cursors.Cursor (see _set_cursor)
+        self._current_cursor: int | None = None
+        self._blit_pairs: List[Tuple[pygame.Surface, Tuple[int, int]]] = []  # reused per frame by _batch_blit callers
+        self._pointer_rect = pygame.Rect(0, 0, 1, 1)  # reused 1x1 rect for per-frame collidelist hit tests
+        # State whose last frame was presented with a full flip (None forces one). While it still
+        # matches, the artifact popup presents only its box and the menu only its changed regions.
+        self._full_frame_state: str | None = None
 
         # Opening sequence (game_op1.png .. game_op7.png in open_scene folder)
-        self.opening_images: List[pygame.Surface] = []
+        self.opening_images: List[pygame.Surface | None] = []  # filled on first display (_opening_image)
         self._load_opening_images()
+        self._prefetch_assets()  # remaining slides, menu and scene art decode in the background
         self.opening_slide_index = 0
         self.opening_timer = 0.0
         self.opening_phase = "fade_in"  # fade_in | holding | fade_out
@@ -732,6 +1203,24 @@ class VanishingMemoriesGame:
         self.menu_bg: pygame.Surface | None = None
         self.clock_images: List[pygame.Surface] = []
         self.clock_rects: List[pygame.Rect] = []  # click areas (centered on positions)
+        # Fixed 3x2 grid centred on screen, clock index 0-5 -> (cx, cy)
+        self._clock_centers: List[Tuple[int, int]] = [
+            (self.WIDTH // 2 + (idx % 3 - 1) * self.CLOCK_SPACING, self.CLOCK_GRID_TOP + idx // 3 * self.CLOCK_SPACING)
+            for idx in range(6)
+        ]
+        # Fixed menu UI: Accuse button (bottom-right) and timer bar (top), shared by draw and click handling
+        self._menu_accuse_rect = pygame.Rect(self.WIDTH - 200, self.HEIGHT - 56, 180, 42)
+        self._menu_timer_bar = pygame.Rect(50, 72, self.WIDTH - 100, 10)
+        self._menu_composites: dict = {}  # dimmed flag -> menu_bg with clocks baked in (see _menu_composite)
+        self._menu_plain_bg: pygame.Surface | None = None  # fallback menu backdrop when menu.png is missing
+        self._menu_accuse_buttons: dict = {}  # hover flag -> pre-drawn Accuse button (see _menu_accuse_button)
+        # Menu regions that may differ from the previous menu frame (None: the whole screen), and
+        # (composite, (hovered clock, accuse hover), hover regions) of that frame to diff against
+        self._menu_dirty: List[pygame.Rect] | None = None
+        self._menu_last_frame: tuple = (None, None, [])
+        self._menu_timer_key: tuple = ()  # (fill width, timer text blits) of that frame
+        self._menu_frame_key: tuple = ()  # everything the clock-art menu frame depends on (see _draw_menu_impl)
+        self._clock_highlights: dict = {}  # clock index -> hover lighten copy (alpha 70)
         self.clock_scene_descriptions = [
             "Scene 1 — Dawn Court (Great Hall)",
             "Scene 2 — The Royal Kitchens (Late Morning)",
@@ -740,12 +1229,13 @@ class VanishingMemoriesGame:
             "Scene 5 — Private Supper (Evening)",
             "Scene 6 — The Bedchamber (Late Night)",
         ]
-        self._load_menu_assets()
+        self._menu_assets_loaded = False  # menu.png / clocks decode on first menu frame or click
 
         # Animation state
         self.menu_time = 0.0
         self.scene_time = 0.0
         self.heartbeat_channel = None
+        self._heartbeat_until = 0.0  # _time_accum before which the current heartbeat is surely still playing
         self.ominous_playing = False
         # Snapshot effect
         self.snapshot_freeze_surface: pygame.Surface | None = None
@@ -754,22 +1244,28 @@ class VanishingMemoriesGame:
         # Camera shake
         self.camera_shake = (0.0, 0.0)
         self.camera_shake_decay = 0.92
-        # Parallax
-        self.parallax_offset = (0.0, 0.0)
+        # Low-time shake jitter, pre-drawn (own RNG, so the global random stream is untouched)
+        rng = random.Random()
+        self._shake_jitter = [(rng.uniform(-2, 2), rng.uniform(-2, 2)) for _ in range(self.SHAKE_JITTER_SIZE)]
+        self._shake_jitter_index = 0
         # Scene fade/dull: per-scene progress 0 = sharp, 1 = fully faded; continues when re-entering
         self.scene_fade_progress: List[float] = [0.0] * 6
         self.SCENE_FADE_DURATION = 42.0 / 3.0  # seconds until fully dulled (3x faster)
         # Hover for accuse
         self.hover_suspect_index = -1
+        # (suspect index, hover, grain frame, w, h) / ("shadow", w, h) -> pre-drawn accuse card layers (see _accuse_card)
+        self._accuse_cards: dict = {}
+        self._accuse_bg: pygame.Surface | None = None  # gradient + vignette, built on first draw_accuse
         # Result animation
         self.result_time = 0.0
         # Artifact popup (when state == "artifact_popup")
         self.popup_artifact_filename: str = ""
         self.popup_scene_index: int = -1
         self.popup_artifact_surface: pygame.Surface | None = None  # larger version for popup, loaded on open
+        self._init_popup_layout()
 
         # Ending sequence (state == "ending"): slides from end_scene folder, fade in/out like opening
-        self.ending_slides: List[dict] = []  # list of {"image": str, "show_memories": bool, "accept_123": bool, "exit_prompt": bool}
+        self.ending_slides: List[EndingSlide] = []
         self.ending_index: int = 0
         self.ending_phase: str = "fade_in"  # fade_in | holding | fade_out
         self.ending_timer: float = 0.0
@@ -784,18 +1280,15 @@ class VanishingMemoriesGame:
         self.ENDING_FADE_OUT = 0.9
         self.ENDING_TYPING_CPS = 38
         self._ending_image_cache: dict = {}  # filename -> Surface, for current run
+        self._ending_memory_rows: dict = {}  # snapshot count -> memories row rects (see _ending_memory_rects)
 
     def _load_ending_image(self, filename: str) -> pygame.Surface:
         """Load an image from end_scene folder and scale to (WIDTH, HEIGHT). Cache by filename."""
         if filename in self._ending_image_cache:
             return self._ending_image_cache[filename]
-        root = os.path.dirname(os.path.abspath(__file__))
-        # Script may be in project root (dihh) or inside end_scene; images live in end_scene/
-        end_folder = os.path.join(root, "end_scene") if os.path.basename(root) != "end_scene" else root
-        path = os.path.join(end_folder, filename)
+        path = os.path.join(_END_DIR, filename)
         try:
-            img = pygame.image.load(path).convert_alpha()
-            surf = pygame.transform.smoothscale(img, (self.WIDTH, self.HEIGHT))
+            surf = load_scaled(path, (self.WIDTH, self.HEIGHT), alpha=False, smooth=False)
         except (pygame.error, FileNotFoundError):
             surf = pygame.Surface((self.WIDTH, self.HEIGHT))
             surf.fill((20, 22, 28))
@@ -803,18 +1296,11 @@ class VanishingMemoriesGame:
         return surf
 
     def _start_ending(self) -> None:
-        """Compute totals from snapshots; build loss or win slide list; set state to ending.
+        """Check the running evidence totals; build loss or win slide list; set state to ending.
         Win = at least one suspect has >= EVIDENCE_POINTS_REQUIRED for that same suspect
         (only the killer can reach 12+ because non-killer 5/10 artifacts are replaced with 0-point items).
         """
-        total_queen = sum(s.points_queen for s in self.snapshots)
-        total_chef = sum(s.points_chef for s in self.snapshots)
-        total_goblin = sum(s.points_goblin for s in self.snapshots)
-        win = (
-            total_queen >= EVIDENCE_POINTS_REQUIRED
-            or total_chef >= EVIDENCE_POINTS_REQUIRED
-            or total_goblin >= EVIDENCE_POINTS_REQUIRED
-        )
+        win = max(self._totals.values()) >= EVIDENCE_POINTS_REQUIRED
         killer_id = self.culprit.id
         killer_be = {"goblin": "gob_be.png", "chef": "chef_be.png", "queen": "queen_be.png"}[killer_id]
 
@@ -830,42 +1316,46 @@ class VanishingMemoriesGame:
                 "chef": BAD_ENDING_CHEF_FREE,
             }[killer_id]
             self.ending_slides = [
-                {"image": "red_cryst.png", "script": BAD_ENDING_RED_CRYSTAL},
-                {"image": "dead_king.png", "script": BAD_ENDING_DEAD_KING},
-                {"image": killer_be, "exit_prompt": True, "script": culprit_script},
+                EndingSlide(image="red_cryst.png", script=BAD_ENDING_RED_CRYSTAL),
+                EndingSlide(image="dead_king.png", script=BAD_ENDING_DEAD_KING),
+                EndingSlide(image=killer_be, exit_prompt=True, script=culprit_script),
             ]
         else:
             self.ending_slides = [
-                {"image": "green_cryst.png", "script": WIN_PATH_G1_GREEN_CRYSTAL},
-                {"image": "the_options.png", "show_memories": True, "script": WIN_PATH_G2_OPTIONS},
-                {"image": "escort_in.png", "show_memories": True, "script": WIN_PATH_G3_ESCORT},
-                {"image": "the_culprits.png", "show_memories": True, "accept_123": True, "script": WIN_PATH_G4_CULPRITS},
+                EndingSlide(image="green_cryst.png", script=WIN_PATH_G1_GREEN_CRYSTAL),
+                EndingSlide(image="the_options.png", show_memories=True, script=WIN_PATH_G2_OPTIONS),
+                EndingSlide(image="escort_in.png", show_memories=True, script=WIN_PATH_G3_ESCORT),
+                EndingSlide(image="the_culprits.png", show_memories=True, accept_123=True, script=WIN_PATH_G4_CULPRITS),
             ]
-        self.ending_index = 0
+        self._show_ending_slide(0)
+        self.state = "ending"
+
+    def _show_ending_slide(self, index: int) -> None:
+        """Fade in ending slide index with its script reset, so the previous slide's text is never shown again."""
+        self.ending_index = index
         self.ending_phase = "fade_in"
         self.ending_timer = 0.0
         self.ending_text_index = 0
         self.ending_char_index = 0
         self.ending_typing_accumulator = 0.0
-        self.state = "ending"
 
     def _ending_append_blood_and_continuation(self) -> None:
         """Called when user presses 1/2/3 on the_culprits: append blood slide (G5), blood_transfer (G6), mage_cooking (G7)."""
         blood_img = {1: "goblin_blood.png", 2: "chef_blood.png", 3: "queen_blood.png"}[self.ending_player_choice]
         g5_script = {1: WIN_PATH_G5_GOBLIN_PLEADS, 2: WIN_PATH_G5_CHEF_PLEADS, 3: WIN_PATH_G5_QUEEN_PLEADS}[self.ending_player_choice]
-        self.ending_slides.append({"image": blood_img, "script": g5_script})
-        self.ending_slides.append({"image": "blood_transfer.png", "script": WIN_PATH_G6_BLOOD_TAKEN})
-        self.ending_slides.append({"image": "mage_cooking.png", "script": WIN_PATH_G7_HANDS_TO_MAGE})
+        self.ending_slides.append(EndingSlide(image=blood_img, script=g5_script))
+        self.ending_slides.append(EndingSlide(image="blood_transfer.png", script=WIN_PATH_G6_BLOOD_TAKEN))
+        self.ending_slides.append(EndingSlide(image="mage_cooking.png", script=WIN_PATH_G7_HANDS_TO_MAGE))
 
     def _ending_append_outcome(self, correct: bool) -> None:
         """Append win or loss sequence after mage_cooking; last slide has exit_prompt."""
         killer_id = self.culprit.id
         killer_be = {"goblin": "gob_be.png", "chef": "chef_be.png", "queen": "queen_be.png"}[killer_id]
         if correct:
-            self.ending_slides.append({"image": "green_cryst.png", "script": GOOD_ENDING_GREEN_CRYSTAL})
-            self.ending_slides.append({"image": "dead_king.png", "script": GOOD_ENDING_DEAD_KING})
-            self.ending_slides.append({"image": "ge1.png", "script": GOOD_ENDING_GE1_REJOICING})
-            self.ending_slides.append({"image": "ge2.png", "exit_prompt": True, "script": GOOD_ENDING_GE2_CORONATION})
+            self.ending_slides.append(EndingSlide(image="green_cryst.png", script=GOOD_ENDING_GREEN_CRYSTAL))
+            self.ending_slides.append(EndingSlide(image="dead_king.png", script=GOOD_ENDING_DEAD_KING))
+            self.ending_slides.append(EndingSlide(image="ge1.png", script=GOOD_ENDING_GE1_REJOICING))
+            self.ending_slides.append(EndingSlide(image="ge2.png", exit_prompt=True, script=GOOD_ENDING_GE2_CORONATION))
         else:
             # Bad Ending II — The False Judgement (wrong accusation, with script)
             culprit_script_ii = {
@@ -873,97 +1363,85 @@ class VanishingMemoriesGame:
                 "chef": BAD_ENDING_II_CHEF_FREE,
                 "goblin": BAD_ENDING_II_GOBLIN_FREE,
             }[killer_id]
-            self.ending_slides.append({"image": "red_cryst.png", "script": BAD_ENDING_II_RED_CRYSTAL})
-            self.ending_slides.append({"image": "dead_king.png", "script": BAD_ENDING_II_DEAD_KING})
-            self.ending_slides.append({"image": killer_be, "exit_prompt": True, "script": culprit_script_ii})
+            self.ending_slides.append(EndingSlide(image="red_cryst.png", script=BAD_ENDING_II_RED_CRYSTAL))
+            self.ending_slides.append(EndingSlide(image="dead_king.png", script=BAD_ENDING_II_DEAD_KING))
+            self.ending_slides.append(EndingSlide(image=killer_be, exit_prompt=True, script=culprit_script_ii))
 
-    def _build_scenes(self, killer_id: str) -> List[MemoryScene]:
-        scenes = []
-        w, h = self.WIDTH, self.SCENE_HEIGHT
-        root = os.path.dirname(os.path.abspath(__file__))
-        scenes_folder = os.path.join(root, "scenes")
-        replacements_folder = os.path.join(root, "replacements")
-        labels = ["09:12", "11:17", "12:03", "14:40", "18:22", "21:10"]
-        # (filename, frac_x, frac_y, rotation_deg, darken [, scale [, offset_x_aw [, offset_y_ah ]]); max_side 80 * scale
-        artifact_specs = [
-            [("q1-1.png", 0.92, 0.5 + 1 / 8 + 0.08, 0, 0.48), ("c1-1.png", 1 / 16, 0.5, 0, 1.0, 0.75), ("g1-1.png", 0.45, 0.5, 0, 1.0, 1 / 3, 1.0, 0)],
-            [("q5-2.png", 0.4, 0.5 + 3 / 16, 8, 1.0), ("c10-1.png", 0.42, 0.5, 0, 0.6, 1.0, 1.0, 0), ("g1-2.png", 5 / 6, 0.25, 0, 1.0, 2 / 3, -0.25, 0)],
-            [("q5-1.png", 7 / 8, 7 / 8, 0, 0.35), ("c1-2.png", 0.45, 0.52, 0, 1.0, 1 / 3), ("g5-1.png", 3 / 4, 0.5, 0, 1.0, 0.5, 0.5, 0.25)],
-            [("q10-2.png", 1 / 8, 7 / 8, 0, 0.35), ("c5-1.png", 1.0, 2 / 3, 0, 0.35, 2 / 3, -0.5, 0), ("g5-2.png", 3 / 8, 0.52, 0, 1.0)],
-            [("q10-1.png", 0.92, 0.5 - 1 / 16, 0, 1.0), ("c5-2.png", 0.25, 0.98, 0, 0.6, 2.0, 0.5, 0), ("g10-1.png", 1 / 4, 0.48, 0, 0.85, 1.0, -0.25, -1.0)],
-            [("q1-2.png", 0.93, 0.58, 0, 0.4), ("c10-2.png", 1 / 3, 1 / 3 - 0.06, 0, 0.35, 1.2, 0.5, 1.0), ("g10-2.png", 1 / 4, 0.5, 0, 0.5, 2 / 3, 0, -1 / 6)],
-        ]
-        tag_options = [
-            ["dna", "time", "access"], ["jealousy", "relationship", "motive"], ["workshop", "insider", "struggle"],
-            ["digital", "lure", "premeditation"], ["poison", "escape", "alibi_break"], ["entry", "forensics", "tools"],
+    def _build_scenes(self) -> List[MemoryScene]:
+        """Create the six scenes unloaded (label only); _load_scene decodes one on first entry."""
+        return [
+            MemoryScene(label=label, background=None, bg_rect=(0, 0, self.WIDTH, self.SCENE_HEIGHT), artifacts=[])
+            for label in self.SCENE_LABELS
         ]
-        for i, label in enumerate(labels):
-            subfolder = f"s{i + 1}"
-            path = os.path.join(scenes_folder, subfolder, f"s{i + 1}.png")
+
+    def _artifact_source(self, i: int, filename: str) -> Tuple[str, str, str, int]:
+        """Resolve artifact filename in scene i to (path, display filename, suspect_id, points).
+
+        Non-killer 5/10 point evidence is swapped for its 0-point replacement image.
+        """
+        orig_filename = sys.intern(filename)
+        load_filename = REPLACEMENT_BY_KILLER[self.culprit.id].get((i, orig_filename))
+        if load_filename is not None:
+            return os.path.join(_REPL_DIR, load_filename), load_filename, "", 0
+        suspect_id, points = _parse_artifact_suspect_and_points(orig_filename)
+        return os.path.join(_SCENES_DIR, f"s{i + 1}", orig_filename), orig_filename, suspect_id, points
+
+    def _scene_background_path(self, i: int) -> str:
+        return os.path.join(_SCENES_DIR, f"s{i + 1}", f"s{i + 1}.png")
+
+    def _prefetch_assets(self) -> None:
+        """Queue background decodes for everything after the first opening slide, in play order."""
+        paths = [os.path.join(_OPEN_DIR, f"game_op{i}.png") for i in range(2, 8)]
+        paths.append(os.path.join(_MENU_DIR, "menu.png"))
+        paths += [os.path.join(_MENU_DIR, f"c{i}.png") for i in range(1, 7)]
+        for i, specs in enumerate(self.SCENE_ARTIFACT_SPECS):
+            paths.append(self._scene_background_path(i))
+            paths += [self._artifact_source(i, spec.filename)[0] for spec in specs]
+        prefetch_images(paths)
+
+    def _load_scene(self, i: int) -> MemoryScene:
+        """Decode scene i's background and artifacts (non-killer evidence swapped for replacements)."""
+        w, h = self.WIDTH, self.SCENE_HEIGHT
+        path = self._scene_background_path(i)
+        ox, oy, bw, bh = 0, 0, w, h
+        try:
+            scaled = load_scaled(path, fit=(w, h), alpha=False)
+            new_w, new_h = scaled.get_width(), scaled.get_height()
+            ox, oy = (w - new_w) // 2, (h - new_h) // 2
+            bw, bh = new_w, new_h
+            bg = pygame.Surface((w, h))
+            bg.fill((28, 30, 38))
+            bg.blit(scaled, (ox, oy))
+        except (pygame.error, FileNotFoundError):
+            # Vertical gradient: fill a 1-px column, then stretch it (nearest) across the width
+            column = pygame.Surface((1, h))
+            if np is not None:
+                u = 1 - np.arange(h, dtype=np.float64) / h
+                pygame.surfarray.blit_array(column, np.stack((55 + 30 * u, 62 + 35 * u, 78 + 35 * u), axis=-1).astype(np.uint8)[None])
+            else:
+                for y in range(h):
+                    t = y / h
+                    column.set_at((0, y), (int(55 + 30 * (1 - t)), int(62 + 35 * (1 - t)), int(78 + 35 * (1 - t))))
+            bg = pygame.transform.scale(column, (w, h))
             ox, oy, bw, bh = 0, 0, w, h
+        artifacts = []
+        for spec in self.SCENE_ARTIFACT_SPECS[i]:
+            art_path, display_filename, suspect_id, points = self._artifact_source(i, spec.filename)
+            self._artifact_paths[(i, display_filename)] = art_path
             try:
-                img = pygame.image.load(path).convert()
-                iw, ih = img.get_width(), img.get_height()
-                scale = min(w / iw, h / ih)
-                new_w = max(1, int(iw * scale))
-                new_h = max(1, int(ih * scale))
-                scaled = pygame.transform.smoothscale(img, (new_w, new_h))
-                ox, oy = (w - new_w) // 2, (h - new_h) // 2
-                bw, bh = new_w, new_h
-                bg = pygame.Surface((w, h))
-                bg.fill((28, 30, 38))
-                bg.blit(scaled, (ox, oy))
+                art_img = load_scaled(art_path, max_side=max(1, int(80 * spec.scale)), rotation=spec.rotation_degrees)
+                load_scaled(art_path, max_side=200)  # popup size, from the same decode (see _load_popup_artifact_image)
+                artifacts.append(SceneArtifact(
+                    surface=art_img, frac_x=spec.frac_x, frac_y=spec.frac_y, tags=self.SCENE_TAG_OPTIONS[i].copy(),
+                    rotation_degrees=spec.rotation_degrees, darken=spec.darken, offset_x_aw=spec.offset_x_aw, offset_y_ah=spec.offset_y_ah,
+                    spec_filename=display_filename, suspect_id=suspect_id, points=points
+                ))
             except (pygame.error, FileNotFoundError):
-                bg = pygame.Surface((w, h))
-                for y in range(h):
-                    t = y / h
-                    pygame.draw.line(bg, (int(55 + 30 * (1 - t)), int(62 + 35 * (1 - t)), int(78 + 35 * (1 - t))), (0, y), (w, y))
-                ox, oy, bw, bh = 0, 0, w, h
-            artifacts = []
-            for spec in artifact_specs[i]:
-                orig_filename = spec[0]
-                suspect_id, points = _parse_artifact_suspect_and_points(orig_filename)
-                use_replacement = (
-                    killer_id != suspect_id
-                    and points in (5, 10)
-                    and (i, orig_filename) in REPLACEMENT_MAP
-                )
-                if use_replacement:
-                    load_filename = REPLACEMENT_MAP[(i, orig_filename)]
-                    art_path = os.path.join(replacements_folder, load_filename)
-                    display_filename = load_filename
-                    points = 0
-                    suspect_id = ""
-                else:
-                    art_path = os.path.join(scenes_folder, subfolder, orig_filename)
-                    display_filename = orig_filename
-                try:
-                    art_img = pygame.image.load(art_path).convert_alpha()
-                    scale_spec = spec[5] if len(spec) > 5 else 1.0
-                    max_side = max(1, int(80 * scale_spec))
-                    aw, ah = art_img.get_width(), art_img.get_height()
-                    if aw > ah:
-                        if aw > max_side:
-                            ah = max(1, int(ah * max_side / aw))
-                            aw = max_side
-                    else:
-                        if ah > max_side:
-                            aw = max(1, int(aw * max_side / ah))
-                            ah = max_side
-                    art_img = pygame.transform.smoothscale(art_img, (aw, ah))
-                    if spec[3] != 0:
-                        art_img = pygame.transform.rotate(art_img, spec[3])
-                    off_x = spec[6] if len(spec) > 6 else 0.0
-                    off_y = spec[7] if len(spec) > 7 else 0.0
-                    artifacts.append(SceneArtifact(
-                        surface=art_img, frac_x=spec[1], frac_y=spec[2], tags=tag_options[i].copy(),
-                        rotation_degrees=spec[3], darken=spec[4], offset_x_aw=off_x, offset_y_ah=off_y,
-                        spec_filename=display_filename, suspect_id=suspect_id, points=points
-                    ))
-                except (pygame.error, FileNotFoundError):
-                    pass
-            scenes.append(MemoryScene(label=label, background=bg, bg_rect=(ox, oy, bw, bh), artifacts=artifacts))
-        return scenes
+                pass
+        scene = self.scenes[i] = MemoryScene(
+            label=self.SCENE_LABELS[i], background=bg, bg_rect=(ox, oy, bw, bh), artifacts=artifacts,
+        )
+        return scene
 
     def _build_suspects(self) -> List[Suspect]:
         return [
@@ -973,32 +1451,32 @@ class VanishingMemoriesGame:
         ]
 
     def _load_opening_images(self) -> None:
-        """Load game_op1.png .. game_op7.png from open_scene folder (next to script)."""
-        root = os.path.dirname(os.path.abspath(__file__))
-        folder = os.path.join(root, "open_scene")
-        for i in range(1, 8):
-            path = os.path.join(folder, f"game_op{i}.png")
+        """Reserve slots for game_op1.png .. game_op7.png; only the first slide is decoded now."""
+        self.opening_images = [None] * 7
+        self._opening_image(0)
+
+    def _opening_image(self, idx: int) -> pygame.Surface:
+        """Return opening slide idx from the open_scene folder, decoding it on first use."""
+        img = self.opening_images[idx]
+        if img is None:
+            path = os.path.join(_OPEN_DIR, f"game_op{idx + 1}.png")
             try:
-                img = pygame.image.load(path).convert()
                 # Scale to fill screen (convert so set_alpha works for fade-in)
-                img = pygame.transform.smoothscale(img, (self.WIDTH, self.HEIGHT))
-                self.opening_images.append(img)
+                img = load_scaled(path, (self.WIDTH, self.HEIGHT), alpha=False, smooth=False)
             except (pygame.error, FileNotFoundError):
                 # Placeholder: dark surface so sequence still runs
-                surf = pygame.Surface((self.WIDTH, self.HEIGHT))
-                surf.fill((20, 22, 28))
-                self.opening_images.append(surf)
-        if not self.opening_images:
-            self.opening_images.append(pygame.Surface((self.WIDTH, self.HEIGHT)))
-            self.opening_images[0].fill((0, 0, 0))
+                img = pygame.Surface((self.WIDTH, self.HEIGHT))
+                img.fill((20, 22, 28))
+            self.opening_images[idx] = img
+        return img
 
     def _load_menu_assets(self) -> None:
-        """Load menu.png and c1.png–c6.png from menu_pics folder. Clocks arranged around center crystal."""
-        root = os.path.dirname(os.path.abspath(__file__))
-        menu_folder = os.path.join(root, "menu_pics")
+        """Load menu.png and c1.png–c6.png from menu_pics folder (once). Clocks arranged around center crystal."""
+        if self._menu_assets_loaded:
+            return
+        self._menu_assets_loaded = True
         try:
-            bg = pygame.image.load(os.path.join(menu_folder, "menu.png")).convert()
-            self.menu_bg = pygame.transform.smoothscale(bg, (self.WIDTH, self.HEIGHT))
+            self.menu_bg = load_scaled(os.path.join(_MENU_DIR, "menu.png"), (self.WIDTH, self.HEIGHT), alpha=False, smooth=False)
         except (pygame.error, FileNotFoundError):
             self.menu_bg = None
         cx, cy = self.WIDTH // 2, self.HEIGHT // 2
@@ -1015,12 +1493,9 @@ class VanishingMemoriesGame:
         tilts = [-6, 6, -6, 6, -6, 6]
         scale = 1 / 3  # clocks at one-third size
         for i in range(1, 7):
-            path = os.path.join(menu_folder, f"c{i}.png")
+            path = os.path.join(_MENU_DIR, f"c{i}.png")
             try:
-                img = pygame.image.load(path).convert_alpha()
-                w, h = max(1, int(img.get_width() * scale)), max(1, int(img.get_height() * scale))
-                img = pygame.transform.smoothscale(img, (w, h))
-                img = pygame.transform.rotate(img, tilts[i - 1])
+                img = load_scaled(path, scale=scale, rotation=tilts[i - 1])
                 self.clock_images.append(img)
                 px, py = cx + offsets[i - 1][0], cy + offsets[i - 1][1]
                 rect = img.get_rect(center=(px, py))
@@ -1028,16 +1503,56 @@ class VanishingMemoriesGame:
             except (pygame.error, FileNotFoundError):
                 self.clock_images.append(pygame.Surface((1, 1)))
                 self.clock_rects.append(pygame.Rect(0, 0, 0, 0))
+        if self.clock_rects[0].width == 0:
+            # Procedural clock fallback: warm the glow sprites its pulse range (0.6–1.0) uses
+            for color in ((60, 70, 90), (80, 130, 190), (100, 160, 220)):
+                for step in range(int(0.6 * GLOW_PULSE_STEPS), GLOW_PULSE_STEPS + 1):
+                    _build_glow_sprite(self.CLOCK_RADIUS - 4, color, step, 15)
+
+    def _set_cursor(self, system_cursor: int) -> None:
+        """Show a pygame.SYSTEM_CURSOR_* cursor; SDL is only called when it differs from the current one."""
+        if system_cursor == self._current_cursor:
+            return
+        try:
+            cursor = self._cursors.get(system_cursor)
+            if cursor is None:
+                cursor = self._cursors[system_cursor] = pygame.cursors.Cursor(system_cursor)
+            pygame.mouse.set_cursor(cursor)
+        except (AttributeError, TypeError):
+            return
+        self._current_cursor = system_cursor
+
+    def _target_fps(self) -> int:
+        """Frame cap for the current state: full FPS while fading, typing or in a scene, lower when static."""
+        if self.state == "menu":
+            return self.MENU_FPS
+        if self.state == "opening" and self.opening_phase == "holding":
+            script = OPENING_SCRIPT[self.opening_slide_index] if self.opening_slide_index < len(OPENING_SCRIPT) else []
+            if self.opening_text_index >= len(script) or self.opening_char_index >= len(script[self.opening_text_index]):
+                return self.IDLE_FPS
+        elif self.state == "ending" and self.ending_phase == "holding":
+            script = self.ending_slides[self.ending_index].script if self.ending_index < len(self.ending_slides) else []
+            if self.ending_text_index >= len(script) or self.ending_char_index >= len(script[self.ending_text_index]):
+                return self.IDLE_FPS
+        return self.FPS
 
     def run(self) -> None:
+        # The loop only handles QUIT, KEYDOWN and left MOUSEBUTTONDOWN; keep the high-rate input
+        # events it would ignore out of the queue (SDL drops them; mouse.get_pos still tracks motion)
+        pygame.event.set_blocked(IGNORED_EVENT_TYPES)
         running = True
         while running:
-            dt = self.clock.tick(self.FPS) / 1000.0
+            dt = self.clock.tick(self._target_fps()) / 1000.0
             self._time_accum += dt
 
-            for event in pygame.event.get():
+            events = pygame.event.get(HANDLED_EVENT_TYPES)
+            # Discard window/audio/etc. events without pumping again, so nothing that arrives after get() is lost
+            pygame.event.clear(pump=False)
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._full_frame_state = None  # window contents lost: next frame is a full repaint
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "opening":
@@ -1055,38 +1570,15 @@ class VanishingMemoriesGame:
                     elif self.state == "ending":
                         if self.ending_index < len(self.ending_slides):
                             slide = self.ending_slides[self.ending_index]
-                            script = slide.get("script", [])
+                            script = slide.script
                             # Exit prompt: only quit when no script or script fully shown
-                            if slide.get("exit_prompt") and (not script or self.ending_text_index >= len(script)):
+                            if slide.exit_prompt and (not script or self.ending_text_index >= len(script)):
                                 running = False
-                            elif slide.get("accept_123"):
-                                if event.key == pygame.K_1:
-                                    self.ending_player_choice = 1
-                                    self._ending_append_blood_and_continuation()
-                                    self.ending_index += 1
-                                    self.ending_phase = "fade_in"
-                                    self.ending_timer = 0.0
-                                    self.ending_text_index = 0
-                                    self.ending_char_index = 0
-                                    self.ending_typing_accumulator = 0.0
-                                elif event.key == pygame.K_2:
-                                    self.ending_player_choice = 2
-                                    self._ending_append_blood_and_continuation()
-                                    self.ending_index += 1
-                                    self.ending_phase = "fade_in"
-                                    self.ending_timer = 0.0
-                                    self.ending_text_index = 0
-                                    self.ending_char_index = 0
-                                    self.ending_typing_accumulator = 0.0
-                                elif event.key == pygame.K_3:
-                                    self.ending_player_choice = 3
+                            elif slide.accept_123:
+                                if pygame.K_1 <= event.key <= pygame.K_3:
+                                    self.ending_player_choice = event.key - pygame.K_1 + 1  # 1=goblin, 2=chef, 3=queen
                                     self._ending_append_blood_and_continuation()
-                                    self.ending_index += 1
-                                    self.ending_phase = "fade_in"
-                                    self.ending_timer = 0.0
-                                    self.ending_text_index = 0
-                                    self.ending_char_index = 0
-                                    self.ending_typing_accumulator = 0.0
+                                    self._show_ending_slide(self.ending_index + 1)
                             elif self.ending_phase == "holding" and event.key == pygame.K_RIGHT:
                                 if script and self.ending_text_index < len(script):
                                     full_text = script[self.ending_text_index]
@@ -1097,7 +1589,7 @@ class VanishingMemoriesGame:
                                             self.ending_text_index += 1
                                             self.ending_char_index = 0
                                             self.ending_typing_accumulator = 0.0
-                                        elif slide.get("exit_prompt"):
+                                        elif slide.exit_prompt:
                                             self.ending_text_index = len(script)  # show exit prompt
                                         else:
                                             self.ending_phase = "fade_out"
@@ -1142,23 +1634,16 @@ class VanishingMemoriesGame:
                     elif self.state == "ending":
                         if self.ending_index < len(self.ending_slides):
                             slide = self.ending_slides[self.ending_index]
-                            script = slide.get("script", [])
-                            if slide.get("exit_prompt") and (not script or self.ending_text_index >= len(script)):
+                            script = slide.script
+                            if slide.exit_prompt and (not script or self.ending_text_index >= len(script)):
                                 running = False
                                 continue
                         if self.ending_memory_popup_index >= 0:
-                            box_w, box_h = 520, 380
-                            box_x = (self.WIDTH - box_w) // 2
-                            box_y = (self.HEIGHT - box_h) // 2
-                            x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
-                            close_hint_surf = self.popup_small_font.render("Close (X)", True, (165, 145, 110))
-                            close_text_rect = pygame.Rect(
-                                box_x + box_w - 24 - close_hint_surf.get_width(),
-                                box_y + box_h - 36,
-                                close_hint_surf.get_width(),
-                                close_hint_surf.get_height(),
-                            )
-                            if x_btn.collidepoint(event.pos) or close_text_rect.collidepoint(event.pos) or not pygame.Rect(box_x, box_y, box_w, box_h).collidepoint(event.pos):
+                            if (
+                                self._memory_popup_x_btn.collidepoint(event.pos)
+                                or self._memory_popup_close_text.collidepoint(event.pos)
+                                or not self._memory_popup_box_rect.collidepoint(event.pos)
+                            ):
                                 self._close_ending_memory_popup()
                             continue
                         self._handle_ending_memory_click(event.pos)
@@ -1184,33 +1669,36 @@ class VanishingMemoriesGame:
                 self.draw_menu()
             elif self.state == "scene":
                 self.draw_scene()
+            elif self.state == "artifact_popup" and self._full_frame_state == "artifact_popup":
+                # Scene behind the modal is frozen: repaint and present only the dialog box
+                self._draw_artifact_popup(backdrop=False)
             elif self.state == "artifact_popup":
                 self.draw_scene()
                 self._draw_artifact_popup()
             elif self.state == "ending":
                 self.draw_ending()
             # Cursor: pointer over popup buttons when in artifact_popup; scene sets pointer over artifacts
-            try:
-                if self.state == "artifact_popup":
-                    mx, my = pygame.mouse.get_pos()
-                    box_w, box_h = 520, 440
-                    box_x = (self.WIDTH - box_w) // 2
-                    box_y = (self.SCENE_HEIGHT - box_h) // 2
-                    x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
-                    btn_y, btn_h = box_y + box_h - 56, 40
-                    cryst_btn = pygame.Rect(box_x + 24, btn_y, 160, btn_h)
-                    uncryst_btn = pygame.Rect(box_x + 24 + 164, btn_y, 130, btn_h)
-                    close_btn = pygame.Rect(box_x + box_w - 24 - 100, btn_y, 100, btn_h)
-                    if x_btn.collidepoint(mx, my) or cryst_btn.collidepoint(mx, my) or uncryst_btn.collidepoint(mx, my) or close_btn.collidepoint(mx, my):
-                        pygame.mouse.set_cursor(pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_HAND))
-                    else:
-                        pygame.mouse.set_cursor(pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_ARROW))
-                elif self.state not in ("scene", "artifact_popup"):
-                    pygame.mouse.set_cursor(pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_ARROW))
-            except (AttributeError, TypeError):
-                pass
+            if self.state == "artifact_popup":
+                mx, my = pygame.mouse.get_pos()
+                self._pointer_rect.topleft = (mx, my)
+                if self._pointer_rect.collidelist(self._popup_buttons) >= 0:
+                    self._set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                else:
+                    self._set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            elif self.state != "scene":
+                self._set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
-            pygame.display.flip()
+            if self.state != self._full_frame_state:
+                self._full_frame_state = self.state
+                pygame.display.flip()
+            elif self.state == "artifact_popup":
+                pygame.display.update(self._popup_box_rect.inflate(4, 4))
+            elif self.state == "menu" and self._menu_dirty is not None:
+                if self._menu_dirty:
+                    pygame.display.update(self._menu_dirty)
+            else:
+                pygame.display.flip()
+        cancel_prefetch()
         pygame.quit()
 
     def _update_opening(self, dt: float) -> None:
@@ -1226,12 +1714,9 @@ class VanishingMemoriesGame:
             # Advance typing effect (use accumulator so we get at least 1 char per frame when needed)
             if self.opening_slide_index < len(OPENING_SCRIPT) and self.opening_text_index < len(OPENING_SCRIPT[self.opening_slide_index]):
                 full_text = OPENING_SCRIPT[self.opening_slide_index][self.opening_text_index]
-                self.opening_typing_accumulator += dt * self.OPENING_TYPING_CPS
-                while self.opening_typing_accumulator >= 1.0 and self.opening_char_index < len(full_text):
-                    self.opening_char_index += 1
-                    self.opening_typing_accumulator -= 1.0
-                if self.opening_char_index >= len(full_text):
-                    self.opening_typing_accumulator = 0.0
+                self.opening_typing_accumulator, self.opening_char_index = advance_typing(
+                    self.opening_typing_accumulator, self.opening_char_index, dt, self.OPENING_TYPING_CPS, len(full_text)
+                )
         elif self.opening_phase == "fade_out":
             if self.opening_timer >= self.OPENING_FADE_OUT_DURATION:
                 self.opening_slide_index += 1
@@ -1253,35 +1738,24 @@ class VanishingMemoriesGame:
                 self.ending_char_index = 0
                 self.ending_typing_accumulator = 0.0
         elif self.ending_phase == "holding":
-            slide = self.ending_slides[self.ending_index] if self.ending_index < len(self.ending_slides) else {}
-            script = slide.get("script", [])
+            script = self.ending_slides[self.ending_index].script if self.ending_index < len(self.ending_slides) else []
             if script and self.ending_text_index < len(script):
                 full_text = script[self.ending_text_index]
-                self.ending_typing_accumulator += dt * self.ENDING_TYPING_CPS
-                while self.ending_typing_accumulator >= 1.0 and self.ending_char_index < len(full_text):
-                    self.ending_char_index += 1
-                    self.ending_typing_accumulator -= 1.0
-                if self.ending_char_index >= len(full_text):
-                    self.ending_typing_accumulator = 0.0
+                self.ending_typing_accumulator, self.ending_char_index = advance_typing(
+                    self.ending_typing_accumulator, self.ending_char_index, dt, self.ENDING_TYPING_CPS, len(full_text)
+                )
         elif self.ending_phase == "fade_out":
             if self.ending_timer >= self.ENDING_FADE_OUT:
                 prev_index = self.ending_index
-                self.ending_index += 1
-                if prev_index < len(self.ending_slides) and self.ending_slides[prev_index].get("image") == "mage_cooking.png":
+                if prev_index < len(self.ending_slides) and self.ending_slides[prev_index].image == "mage_cooking.png":
                     correct = (
                         (self.ending_player_choice == 1 and self.culprit.id == "goblin")
                         or (self.ending_player_choice == 2 and self.culprit.id == "chef")
                         or (self.ending_player_choice == 3 and self.culprit.id == "queen")
                     )
                     self._ending_append_outcome(correct)
-                self.ending_timer = 0.0
-                # Reset script state for the new slide so previous slide's text is never shown again
-                self.ending_text_index = 0
-                self.ending_char_index = 0
-                self.ending_typing_accumulator = 0.0
-                if self.ending_index < len(self.ending_slides):
-                    self.ending_phase = "fade_in"
-                else:
+                self._show_ending_slide(prev_index + 1)
+                if self.ending_index >= len(self.ending_slides):
                     self.ending_phase = "holding"  # stay on last (should not happen; last has exit_prompt)
 
     def _update_global_timer(self, dt: float) -> None:
@@ -1297,57 +1771,122 @@ class VanishingMemoriesGame:
         if len(self.snapshots) >= self.MAX_SNAPSHOTS and self.state == "menu":
             self._start_ending()
 
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Antialiased font.render through a bounded LRU cache. Do not draw on the result."""
+        key = (font, text, color)
+        cache = self._text_cache
+        surf = cache.pop(key, None)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(cache) >= self.TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = surf
+        return surf
+
+    def _wrap_text(self, font: pygame.font.Font, text: str, max_width: int) -> List[str]:
+        """Greedy word wrap of text to max_width pixels, memoised per (font, max_width, text)."""
+        key = (font, max_width, text)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        # Measure each candidate line as a whole string: summed word widths drift from the
+        # rendered width (kerning/rounding) and would wrap differently
+        lines, line = [], []
+        for word in text.split():
+            if not line or font.size(" ".join(line + [word]))[0] <= max_width:
+                line.append(word)
+            else:
+                lines.append(" ".join(line))
+                line = [word]
+        if line:
+            lines.append(" ".join(line))
+        self._wrap_cache[key] = lines
+        return lines
+
+    def _text_block_blits(
+        self, font: pygame.font.Font, text: str, max_width: int, pos: Tuple[int, int], line_height: int,
+        max_bottom: int, layers: Tuple[Tuple[Tuple[int, int, int], int], ...],
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Word-wrapped text block as (surface, pos) pairs for _batch_blit, memoised per arguments.
+
+        Each line is rendered once per (color, offset) layer, e.g. ((shadow, 1), (text, 0)) for a drop
+        shadow; lines whose bottom would pass max_bottom are left out.
+        """
+        key = (font, text, max_width, pos, line_height, max_bottom, layers)
+        pairs = self._text_blocks.get(key)
+        if pairs is None:
+            x, y = pos
+            pairs = []
+            for i, line in enumerate(self._wrap_text(font, text, max_width)):
+                if y + (i + 1) * line_height > max_bottom:
+                    break
+                for color, offset in layers:
+                    pairs.append((font.render(line, True, color), (x + offset, y + i * line_height + offset)))
+            self._text_blocks[key] = pairs
+        return pairs
+
+    def _snapshot_polaroid_blits(
+        self, snap: Snapshot, rect: pygame.Rect, thumb_size: Tuple[int, int], tilt: float,
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Blit pairs drawing a snapshot as a polaroid; layers are rendered once per layout and kept on the snapshot."""
+        key = (rect.size, thumb_size, tilt)
+        layers = snap.polaroids.get(key)
+        if layers is None:
+            thumb = pygame.transform.smoothscale(snap.surface, thumb_size)
+            layers = snap.polaroids[key] = render_polaroid(rect.size, thumb, tilt)
+        return polaroid_blits(rect, layers, tilt)
+
+    def _batch_blit(self, pairs: List[Tuple[pygame.Surface, Tuple[int, int]]], flag: int = 0) -> None:
+        """Blit (surface, pos) pairs to the screen in a single call."""
+        if not pairs:
+            return
+        if _HAS_FBLITS:
+            self.screen.fblits(pairs, flag)
+        elif flag:
+            self.screen.blits([(src, pos, None, flag) for src, pos in pairs], doreturn=False)
+        else:
+            self.screen.blits(pairs, doreturn=False)
+
     def _clock_center(self, idx: int) -> Tuple[int, int]:
         """Get screen position of clock index (0-5). Grid centered on screen."""
-        col, row = idx % 3, idx // 3
-        cx = self.WIDTH // 2 + (col - 1) * self.CLOCK_SPACING
-        cy = self.CLOCK_GRID_TOP + row * self.CLOCK_SPACING
-        return (cx, cy)
+        return self._clock_centers[idx]
 
     def _handle_menu_click(self, pos: Tuple[int, int]) -> None:
         # Accuse button (bottom-right): go to ending (no accusation screen)
-        accuse_rect = pygame.Rect(self.WIDTH - 200, self.HEIGHT - 56, 180, 42)
-        if accuse_rect.collidepoint(pos):
+        if self._menu_accuse_rect.collidepoint(pos):
             self._start_ending()
             return
         if self.global_time <= 0.0:
             return
+        self._load_menu_assets()
         # Clock hit test: use image rects if we have 6 clock assets, else legacy circle grid
         if len(self.clock_rects) >= 6 and all(self.clock_rects[i].width > 0 for i in range(6)):
-            for idx, rect in enumerate(self.clock_rects):
-                if rect.collidepoint(pos):
-                    self.current_scene_index = idx
-                    self.scene_time = 0.0
-                    self.state = "scene"
-                    break
+            idx = pygame.Rect(pos[0], pos[1], 1, 1).collidelist(self.clock_rects)
         else:
-            for idx, scene in enumerate(self.scenes):
-                cx, cy = self._clock_center(idx)
-                if (pos[0] - cx) ** 2 + (pos[1] - cy) ** 2 <= self.CLOCK_RADIUS ** 2:
-                    self.current_scene_index = idx
-                    self.scene_time = 0.0
-                    self.state = "scene"
-                    break
+            mx, my = pos
+            radius_sq = self.CLOCK_RADIUS ** 2
+            idx = next((i for i, (cx, cy) in enumerate(self._clock_centers) if (mx - cx) ** 2 + (my - cy) ** 2 <= radius_sq), -1)
+        if idx >= 0:
+            self._enter_scene(idx)
+
+    def _enter_scene(self, idx: int) -> None:
+        """Switch to scene idx, decoding its images the first time it is visited."""
+        if self.scenes[idx].background is None:
+            self._load_scene(idx)
+        self.current_scene_index = idx
+        self.scene_time = 0.0
+        self.state = "scene"
 
     def _get_artifact_index_at_pos(self, pos: Tuple[int, int]) -> int:
         """Return index of artifact under pos in current scene, or -1. Uses same rect logic as draw_scene."""
         if self.current_scene_index < 0:
             return -1
         scene = self.scenes[self.current_scene_index]
-        ox, oy, bw, bh = scene.bg_rect
-        mx, my = pos
-        shake_x = int(self.camera_shake[0])
-        shake_y = int(self.camera_shake[1])
-        for i, art in enumerate(scene.artifacts):
-            cx = ox + int(art.frac_x * bw)
-            cy = oy + int(art.frac_y * bh)
-            sw, sh = art.surface.get_width(), art.surface.get_height()
-            dx = cx - sw // 2 + shake_x + int(art.offset_x_aw * sw)
-            dy = cy - sh // 2 + shake_y + int(art.offset_y_ah * sh)
-            r = pygame.Rect(dx, dy, sw, sh)
-            if r.collidepoint(mx, my):
-                return i
-        return -1
+        # Shift the point instead of every rect; collidelist returns the first hit like draw order
+        mx = pos[0] - int(self.camera_shake[0])
+        my = pos[1] - int(self.camera_shake[1])
+        self._pointer_rect.topleft = (mx, my)
+        return self._pointer_rect.collidelist(scene.artifact_rects)
 
     def _handle_scene_click(self, pos: Tuple[int, int]) -> None:
         idx = self._get_artifact_index_at_pos(pos)
@@ -1365,6 +1904,64 @@ class VanishingMemoriesGame:
         self._load_popup_artifact_image()
         self.state = "artifact_popup"
 
+    def _init_popup_layout(self) -> None:
+        """Build the artifact and ending-memory popup rects (fixed for the window size).
+
+        They are shared read-only by the popup draws, click handlers and the cursor check.
+        """
+        box_w, box_h = 520, 440
+        box_x, box_y = (self.WIDTH - box_w) // 2, (self.SCENE_HEIGHT - box_h) // 2
+        btn_y, btn_h = box_y + box_h - 56, 40
+        self._popup_box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
+        self._popup_x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
+        self._popup_cryst_btn = pygame.Rect(box_x + 24, btn_y, 160, btn_h)
+        self._popup_uncryst_btn = pygame.Rect(box_x + 24 + 164, btn_y, 130, btn_h)
+        self._popup_close_btn = pygame.Rect(box_x + box_w - 24 - 100, btn_y, 100, btn_h)
+        self._popup_buttons = [self._popup_x_btn, self._popup_cryst_btn, self._popup_uncryst_btn, self._popup_close_btn]
+        # Static chrome (frame, parchment, flourishes, rules, X button) drawn once, so the popup
+        # draw starts with a single blit. It covers the box plus its 2 px shadow band and the
+        # bottom flourishes, which reach 8 px below the box (transparent elsewhere there).
+        chrome = self._popup_chrome = pygame.Surface((box_w + 4, box_h + 11), pygame.SRCALPHA)
+        bx, by = 2, 2  # box origin inside the chrome surface
+        margin = 12
+        # Medieval frame: outer shadow/dark band
+        chrome.fill((35, 28, 22), (0, 0, box_w + 4, box_h + 4))
+        # Outer border (dark wood / iron)
+        pygame.draw.rect(chrome, (55, 42, 32), (bx, by, box_w, box_h), 4)
+        # Inner margin band (lighter)
+        pygame.draw.rect(chrome, (75, 58, 42), (bx + 4, by + 4, box_w - 8, box_h - 8), 2)
+        # Parchment gradient inside the frame margin: one colour per row, darker towards top/bottom edges
+        inner_w, inner_h = box_w - 2 * margin, box_h - 2 * margin
+        for dy in range(inner_h):
+            t = dy / max(1, inner_h)
+            edge = min(dy, inner_h - 1 - dy, margin * 2) / (margin * 2)
+            r = int(72 + 18 * (1 - t) + 12 * (1 - edge))
+            g = int(58 + 14 * (1 - t) + 10 * (1 - edge))
+            b = int(42 + 10 * (1 - t) + 8 * (1 - edge))
+            chrome.fill((max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))), (bx + margin, by + margin + dy, inner_w, 1))
+        # Ornate corner flourishes (L-shaped)
+        flourish_w = 20
+        fc = (100, 78, 55)
+        for (cx, cy), (dx, dy) in [((bx, by), (1, 1)), ((bx + box_w, by), (-1, 1)), ((bx + box_w, by + box_h), (-1, -1)), ((bx, by + box_h), (1, -1))]:
+            pygame.draw.line(chrome, fc, (cx, cy + 8), (cx, cy + flourish_w * dy), 2)
+            pygame.draw.line(chrome, fc, (cx + 8 * dx, cy), (cx + flourish_w * dx, cy), 2)
+            pygame.draw.line(chrome, (130, 100, 72), (cx + 2 * dx, cy + 2 * dy), (cx + 6 * dx, cy + 6 * dy), 1)
+        # Top/bottom decorative double line
+        pygame.draw.line(chrome, (90, 70, 50), (bx + 28, by + 44), (bx + box_w - 28, by + 44), 1)
+        pygame.draw.line(chrome, (110, 85, 60), (bx + 28, by + 46), (bx + box_w - 28, by + 46), 1)
+        # X close button (engraved look)
+        x_btn = self._popup_x_btn.move(bx - box_x, by - box_y)
+        pygame.draw.rect(chrome, (58, 45, 35), x_btn)
+        pygame.draw.rect(chrome, (95, 75, 52), x_btn, 2)
+        pygame.draw.line(chrome, (180, 160, 120), (x_btn.left + 7, x_btn.top + 7), (x_btn.right - 7, x_btn.bottom - 7), 2)
+        pygame.draw.line(chrome, (180, 160, 120), (x_btn.right - 7, x_btn.top + 7), (x_btn.left + 7, x_btn.bottom - 7), 2)
+        box_w, box_h = 520, 380
+        box_x, box_y = (self.WIDTH - box_w) // 2, (self.HEIGHT - box_h) // 2
+        close_w, close_h = self.popup_small_font.size("Close (X)")
+        self._memory_popup_box_rect = pygame.Rect(box_x, box_y, box_w, box_h)
+        self._memory_popup_x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
+        self._memory_popup_close_text = pygame.Rect(box_x + box_w - 24 - close_w, box_y + box_h - 36, close_w, close_h)
+
     def _close_artifact_popup(self) -> None:
         """Return to scene and clear popup state including cached image."""
         self.state = "scene"
@@ -1372,85 +1969,84 @@ class VanishingMemoriesGame:
         self.popup_scene_index = -1
         self.popup_artifact_surface = None
 
+    def _artifact_path(self, scene_index: int, filename: str) -> str:
+        """Image path of a displayed artifact (as resolved by _load_scene; r<N>.png lives in replacements/)."""
+        path = self._artifact_paths.get((scene_index, filename))
+        if path is None:
+            fn = filename.lower()
+            if fn.startswith("r") and fn.endswith(".png") and fn[1:-4].isdigit():
+                path = os.path.join(_REPL_DIR, filename)
+            else:
+                path = os.path.join(_SCENES_DIR, f"s{scene_index + 1}", filename)
+            self._artifact_paths[(scene_index, filename)] = path
+        return path
+
     def _load_popup_artifact_image(self) -> None:
         """Load a larger version of the artifact image for the popup. Clears previous if any."""
         self.popup_artifact_surface = None
         if self.popup_scene_index < 0 or not self.popup_artifact_filename:
             return
-        root = os.path.dirname(os.path.abspath(__file__))
-        fn = self.popup_artifact_filename.lower()
-        if fn.startswith("r") and fn.endswith(".png") and fn[1:-4].isdigit():
-            path = os.path.join(root, "replacements", self.popup_artifact_filename)
-        else:
-            subfolder = f"s{self.popup_scene_index + 1}"
-            path = os.path.join(root, "scenes", subfolder, self.popup_artifact_filename)
         try:
-            img = pygame.image.load(path).convert_alpha()
-            max_side = 200
-            w, h = img.get_width(), img.get_height()
-            if w > h:
-                if w > max_side:
-                    h = max(1, int(h * max_side / w))
-                    w = max_side
-            else:
-                if h > max_side:
-                    w = max(1, int(w * max_side / h))
-                    h = max_side
-            self.popup_artifact_surface = pygame.transform.smoothscale(img, (w, h))
+            self.popup_artifact_surface = load_scaled(
+                self._artifact_path(self.popup_scene_index, self.popup_artifact_filename), max_side=200
+            )
         except (pygame.error, FileNotFoundError):
             pass
 
     def _handle_artifact_popup_click(self, pos: Tuple[int, int]) -> None:
-        # Popup layout: same rects as _draw_artifact_popup (box_h 440)
-        box_w, box_h = 520, 440
-        box_x = (self.WIDTH - box_w) // 2
-        box_y = (self.SCENE_HEIGHT - box_h) // 2
-        x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
-        if x_btn.collidepoint(pos):
+        # Popup layout: same rects as _draw_artifact_popup (built in __init__)
+        if self._popup_x_btn.collidepoint(pos):
             self._close_artifact_popup()
             return
         scene = self.scenes[self.popup_scene_index] if self.popup_scene_index >= 0 else None
-        # Uncrystallize only from the same artifact that triggered the snapshot (or if snapshot was from keyboard S)
-        can_uncrystallize_here = bool(
-            scene and any(
-                s.scene_label == scene.label and (s.trigger_artifact_filename is None or s.trigger_artifact_filename == self.popup_artifact_filename)
-                for s in self.snapshots
-            )
-        )
-        btn_y = box_y + box_h - 56
-        btn_h = 40
-        cryst_btn = pygame.Rect(box_x + 24, btn_y, 160, btn_h)
-        uncryst_btn = pygame.Rect(box_x + 24 + 164, btn_y, 130, btn_h)
-        close_btn = pygame.Rect(box_x + box_w - 24 - 100, btn_y, 100, btn_h)
-        if cryst_btn.collidepoint(pos):
+        can_uncrystallize_here = self._can_uncrystallize_here()
+        if self._popup_cryst_btn.collidepoint(pos):
             if len(self.snapshots) < self.MAX_SNAPSHOTS:
                 self._take_snapshot_from_popup()
                 self.popup_artifact_filename = ""
                 self.popup_scene_index = -1
                 self.popup_artifact_surface = None
             return
-        if uncryst_btn.collidepoint(pos) and can_uncrystallize_here:
-            for i in range(len(self.snapshots) - 1, -1, -1):
-                if self.snapshots[i].scene_label == scene.label:
-                    self.snapshots.pop(i)
-                    break
+        if self._popup_uncryst_btn.collidepoint(pos) and can_uncrystallize_here:
+            self._remove_snapshot(self._snapshots_by_label[scene.label][-1])  # latest from this scene
             self._close_artifact_popup()
             return
-        if close_btn.collidepoint(pos):
+        if self._popup_close_btn.collidepoint(pos):
             self._close_artifact_popup()
             return
-        if not pygame.Rect(box_x, box_y, box_w, box_h).collidepoint(pos):
+        if not self._popup_box_rect.collidepoint(pos):
             self._close_artifact_popup()
 
+    def _can_uncrystallize_here(self) -> bool:
+        """Uncrystallize only from the same artifact that triggered the snapshot (or if snapshot was from keyboard S)."""
+        if self.popup_scene_index < 0:
+            return False
+        return any(
+            s.trigger_artifact_filename is None or s.trigger_artifact_filename == self.popup_artifact_filename
+            for s in self._snapshots_by_label.get(self.scenes[self.popup_scene_index].label, ())
+        )
+
+    def _add_snapshot(self, snap: Snapshot) -> None:
+        self.snapshots.append(snap)
+        self._snapshots_by_label.setdefault(snap.scene_label, []).append(snap)
+        self._totals["queen"] += snap.points_queen
+        self._totals["chef"] += snap.points_chef
+        self._totals["goblin"] += snap.points_goblin
+
+    def _remove_snapshot(self, snap: Snapshot) -> None:
+        self.snapshots.remove(snap)
+        self._snapshots_by_label[snap.scene_label].remove(snap)
+        self._totals["queen"] -= snap.points_queen
+        self._totals["chef"] -= snap.points_chef
+        self._totals["goblin"] -= snap.points_goblin
+
     def _take_snapshot_from_popup(self) -> None:
         """Take a snapshot from the artifact popup. Only the clicked artifact's points count (not the whole scene)."""
         if len(self.snapshots) >= self.MAX_SNAPSHOTS:
             return
         if self.popup_scene_index < 0:
             return
-        scene_h = self.SCENE_HEIGHT
-        self.snapshot_freeze_surface = pygame.Surface((self.WIDTH, scene_h))
-        self.snapshot_freeze_surface.blit(self.screen, (0, 0), (0, 0, self.WIDTH, scene_h))
+        self.snapshot_freeze_surface = self.screen.subsurface((0, 0, self.WIDTH, self.SCENE_HEIGHT)).copy()
         self.snapshot_effect_time = 0.0
         self.snapshot_flash_alpha = 255
         if self.sounds:
@@ -1469,8 +2065,9 @@ class VanishingMemoriesGame:
                 p_goblin = art.points
             captured_tags = list(art.tags)
             break
-        snap_surf = self.snapshot_freeze_surface.copy()
-        self.snapshots.append(
+        # The freeze frame is never drawn on, so the snapshot shares it instead of copying it again
+        snap_surf = self.snapshot_freeze_surface
+        self._add_snapshot(
             Snapshot(surface=snap_surf, tags=captured_tags, scene_label=scene.label, points_queen=p_queen, points_chef=p_chef, points_goblin=p_goblin, trigger_artifact_filename=self.popup_artifact_filename)
         )
         self.state = "snapshot_effect"
@@ -1479,22 +2076,17 @@ class VanishingMemoriesGame:
         if self.current_scene_index < 0:
             return
         self.scene_time += dt
-        if self.current_scene_index >= 0 and self.current_scene_index < len(self.scene_fade_progress):
-            self.scene_fade_progress[self.current_scene_index] = min(
-                1.0, self.scene_fade_progress[self.current_scene_index] + dt / self.SCENE_FADE_DURATION
-            )
-        scene = self.scenes[self.current_scene_index]
-        # Parallax
-        self.parallax_offset = (
-            math.sin(self.scene_time * 0.15) * 4,
-            math.sin(self.scene_time * 0.12) * 3,
-        )
-        # Camera shake when time is low
-        if self.global_time < 25 and self.global_time > 0:
-            self.camera_shake = (
-                self.camera_shake[0] + random.uniform(-2, 2),
-                self.camera_shake[1] + random.uniform(-2, 2),
-            )
+        # Only the open scene dulls, so one slot is updated per frame
+        idx, progress = self.current_scene_index, self.scene_fade_progress
+        if idx < len(progress) and progress[idx] < 1.0:
+            progress[idx] = min(1.0, progress[idx] + dt / self.SCENE_FADE_DURATION)
+        # Camera shake when time is low (both axes in locals, one tuple stored per frame)
+        shake_x, shake_y = self.camera_shake
+        if 0 < self.global_time < 25:
+            jitter_x, jitter_y = self._shake_jitter[self._shake_jitter_index]
+            self._shake_jitter_index = (self._shake_jitter_index + 1) & (self.SHAKE_JITTER_SIZE - 1)
+            shake_x += jitter_x
+            shake_y += jitter_y
             if not self.ominous_playing and self.sounds:
                 self.sounds["ominous"].play(loops=-1)
                 self.ominous_playing = True
@@ -1502,17 +2094,14 @@ class VanishingMemoriesGame:
             if self.ominous_playing and self.sounds:
                 self.sounds["ominous"].stop()
                 self.ominous_playing = False
-        self.camera_shake = (
-            self.camera_shake[0] * self.camera_shake_decay,
-            self.camera_shake[1] * self.camera_shake_decay,
-        )
+        if shake_x or shake_y:  # at rest until the low-time phase; 0 * decay stays 0, so skip the store
+            decay = self.camera_shake_decay
+            self.camera_shake = (shake_x * decay, shake_y * decay)
 
     def _take_snapshot(self) -> None:
         if len(self.snapshots) >= self.MAX_SNAPSHOTS:
             return
-        scene_h = self.SCENE_HEIGHT
-        self.snapshot_freeze_surface = pygame.Surface((self.WIDTH, scene_h))
-        self.snapshot_freeze_surface.blit(self.screen, (0, 0), (0, 0, self.WIDTH, scene_h))
+        self.snapshot_freeze_surface = self.screen.subsurface((0, 0, self.WIDTH, self.SCENE_HEIGHT)).copy()
         self.snapshot_effect_time = 0.0
         self.snapshot_flash_alpha = 255
         if self.sounds:
@@ -1528,8 +2117,9 @@ class VanishingMemoriesGame:
                 p_chef += art.points
             elif art.suspect_id == "goblin":
                 p_goblin += art.points
-        snap_surf = self.snapshot_freeze_surface.copy()
-        self.snapshots.append(
+        # The freeze frame is never drawn on, so the snapshot shares it instead of copying it again
+        snap_surf = self.snapshot_freeze_surface
+        self._add_snapshot(
             Snapshot(surface=snap_surf, tags=captured_tags, scene_label=scene.label, points_queen=p_queen, points_chef=p_chef, points_goblin=p_goblin, trigger_artifact_filename=None)
         )
         self.state = "snapshot_effect"
@@ -1542,38 +2132,32 @@ class VanishingMemoriesGame:
             self.current_scene_index = -1
             self.snapshot_freeze_surface = None
 
-    def _handle_accuse_click(self, pos: Tuple[int, int]) -> None:
+    def _accuse_card_at(self, mx: int, my: int) -> int:
+        """Index of the suspect card under (mx, my), or -1. Cards form one evenly spaced column (see draw_accuse)."""
         card_w, card_h = 260, 115
         margin_x, margin_y = 60, 160
         spacing_y = 125
-        for idx, s in enumerate(self.suspects):
-            x, y = margin_x, margin_y + idx * spacing_y
-            if x <= pos[0] <= x + card_w and y <= pos[1] <= y + card_h:
-                self.selected_suspect = s
-                self._compute_result()
-                self.state = "result"
-                self.result_time = 0.0
-                break
+        if margin_x <= mx <= margin_x + card_w:
+            idx, dy = divmod(my - margin_y, spacing_y)
+            if 0 <= idx < len(self.suspects) and dy <= card_h:
+                return idx
+        return -1
+
+    def _handle_accuse_click(self, pos: Tuple[int, int]) -> None:
+        idx = self._accuse_card_at(pos[0], pos[1])
+        if idx >= 0:
+            self.selected_suspect = self.suspects[idx]
+            self._compute_result()
+            self.state = "result"
+            self.result_time = 0.0
 
     def _update_accuse_hover(self, mx: int, my: int) -> None:
-        card_w, card_h = 260, 115
-        margin_x, margin_y = 60, 160
-        spacing_y = 125
-        self.hover_suspect_index = -1
-        for idx in range(len(self.suspects)):
-            x, y = margin_x, margin_y + idx * spacing_y
-            if x <= mx <= x + card_w and y <= my <= y + card_h:
-                self.hover_suspect_index = idx
-                break
+        self.hover_suspect_index = self._accuse_card_at(mx, my)
 
     def _compute_result(self) -> None:
         if not self.selected_suspect:
             return
-        total_queen = sum(s.points_queen for s in self.snapshots)
-        total_chef = sum(s.points_chef for s in self.snapshots)
-        total_goblin = sum(s.points_goblin for s in self.snapshots)
-        sid = self.selected_suspect.id
-        total_accused = total_queen if sid == "queen" else (total_chef if sid == "chef" else total_goblin)
+        total_accused = self._totals[self.selected_suspect.id]
         is_culprit = self.selected_suspect.id == self.culprit.id
         success = is_culprit and total_accused >= EVIDENCE_POINTS_REQUIRED
         self.result_success = success
@@ -1596,81 +2180,111 @@ class VanishingMemoriesGame:
                 )
 
     # ---------- Draw: Opening sequence ----------
-    def _wrap_opening_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
-        """Split text by newlines, word-wrap each paragraph to max_width. Returns list of lines."""
-        lines_out: List[str] = []
-        for para in text.split("\n"):
-            words = para.split()
-            line = []
-            for word in words:
-                test = " ".join(line + [word])
-                if font.size(test)[0] <= max_width:
-                    line.append(word)
-                else:
-                    if line:
-                        lines_out.append(" ".join(line))
-                    line = [word]
-            if line:
-                lines_out.append(" ".join(line))
-        return lines_out
+    def _script_layout(self, full_text: str) -> Tuple[str, List[int], List[Tuple[int, str, List[int]]], list]:
+        """Lay out and render a full 'Speaker\\nDialogue' script line once, so the typing effect only clips it.
 
-    def _draw_opening_text_box(self) -> None:
-        """Draw the current opening slide text box at bottom with typing effect. Format: 'Speaker\\nDialogue'."""
-        slide_idx = self.opening_slide_index
-        if slide_idx >= len(OPENING_SCRIPT) or self.opening_text_index >= len(OPENING_SCRIPT[slide_idx]):
-            return
-        full_text = OPENING_SCRIPT[slide_idx][self.opening_text_index]
-        display_text = full_text[: self.opening_char_index]
+        Returns (speaker, speaker x offsets, [(start offset in dialogue, line, x offsets), ...], renders) where
+        x offsets[n] is the pixel width of the first n characters; dialogue is word-wrapped per paragraph.
+        renders holds a (shadow, text) surface pair for the speaker, then one per dialogue line.
+        """
+        layout = self._script_layouts.get(full_text)
+        if layout is not None:
+            return layout
         font = self.popup_text_font
-        speaker_font = self.popup_small_font
+        max_width = self.WIDTH - 2 * 80 - 48
+        speaker, _, dialogue = full_text.partition("\n")
+
+        def offsets(f: pygame.font.Font, text: str) -> List[int]:
+            return [f.size(text[:n])[0] for n in range(len(text) + 1)]
+
+        lines: List[Tuple[int, str, List[int]]] = []
+        para_start = 0
+        for para in dialogue.split("\n"):
+            line_start = line_end = -1
+            for m in re.finditer(r"\S+", para):
+                word_start, word_end = para_start + m.start(), para_start + m.end()
+                if line_start < 0:
+                    line_start, line_end = word_start, word_end
+                elif font.size(dialogue[line_start:word_end])[0] <= max_width:
+                    line_end = word_end
+                else:
+                    lines.append((line_start, dialogue[line_start:line_end], offsets(font, dialogue[line_start:line_end])))
+                    line_start, line_end = word_start, word_end
+            if line_start >= 0:
+                lines.append((line_start, dialogue[line_start:line_end], offsets(font, dialogue[line_start:line_end])))
+            para_start += len(para) + 1
+        renders = [
+            (f.render(text, True, self.SCRIPT_SHADOW_COLOR), f.render(text, True, color))
+            for f, text, color in [(self.popup_small_font, speaker, self.SCRIPT_SPEAKER_COLOR)]
+            + [(font, line, self.SCRIPT_TEXT_COLOR) for _, line, _ in lines]
+        ]
+        layout = (speaker, offsets(self.popup_small_font, speaker), lines, renders)
+        self._script_layouts[full_text] = layout
+        return layout
+
+    def _script_panel(self, w: int, h: int) -> pygame.Surface:
+        """Semi-transparent dark panel with border for the script box; one per box size (the height grows with the text)."""
+        panel = self._script_panels.get((w, h))
+        if panel is None:
+            panel = pygame.Surface((w, h), pygame.SRCALPHA)
+            panel.fill((18, 16, 22, 220))
+            pygame.draw.rect(panel, (80, 70, 55, 180), (0, 0, w, h), 2, border_radius=8)
+            pygame.draw.rect(panel, (120, 105, 75, 120), (0, 0, w, h), 1, border_radius=8)
+            self._script_panels[(w, h)] = panel
+        return panel
+
+    def _draw_script_box(self, full_text: str, char_index: int, max_box_h: int, at_top: bool = False) -> None:
+        """Draw a script text box (opening and ending) with the first char_index characters typed out."""
+        speaker, speaker_offsets, lines, renders = self._script_layout(full_text)
+        text_h, speaker_h = self._script_text_height, self._script_speaker_height
         box_margin_x = 80
         box_margin_bottom = 52
         box_max_width = self.WIDTH - 2 * box_margin_x
-        line_height = font.get_height() + 4
+        line_height = text_h + 4
         padding = 20
-        # Split into speaker (first line) and dialogue (rest)
-        if "\n" in display_text:
-            speaker_text, dialogue_text = display_text.split("\n", 1)
-        else:
-            speaker_text = display_text if display_text else ""
-            dialogue_text = ""
-        wrapped = self._wrap_opening_text(dialogue_text, font, box_max_width - 48) if dialogue_text else []
-        speaker_height = (speaker_font.get_height() + 2) if speaker_text else 0
-        if speaker_text:
+        # Split into speaker (first line) and the dialogue lines reached so far
+        speaker_chars = min(char_index, len(speaker))
+        dialogue_chars = char_index - len(speaker) - 1
+        shown = [
+            (line_renders, line_offsets[min(dialogue_chars - start, len(line))])
+            for (start, line, line_offsets), line_renders in zip(lines, renders[1:])
+            if start < dialogue_chars
+        ]
+        speaker_height = (speaker_h + 2) if speaker_chars else 0
+        if speaker_chars:
             speaker_height += 4  # gap below speaker
-        box_h = speaker_height + (len(wrapped) * line_height + 2 * padding) if wrapped else (line_height + 2 * padding)
-        box_h = min(max(box_h, 80), 200)
-        box_y = self.HEIGHT - box_h - box_margin_bottom
+        box_h = speaker_height + (len(shown) * line_height + 2 * padding) if shown else (line_height + 2 * padding)
+        box_h = min(max(box_h, 80), max_box_h)
+        box_y = 52 if at_top else self.HEIGHT - box_h - box_margin_bottom
         box_x = (self.WIDTH - box_max_width) // 2
         box_rect = pygame.Rect(box_x, box_y, box_max_width, box_h)
-        # Semi-transparent dark panel with border
-        panel = pygame.Surface((box_rect.w, box_rect.h), pygame.SRCALPHA)
-        panel.fill((18, 16, 22, 220))
-        pygame.draw.rect(panel, (80, 70, 55, 180), (0, 0, box_rect.w, box_rect.h), 2, border_radius=8)
-        pygame.draw.rect(panel, (120, 105, 75, 120), (0, 0, box_rect.w, box_rect.h), 1, border_radius=8)
-        self.screen.blit(panel, box_rect.topleft)
-        text_color = (232, 225, 210)
-        shadow_color = (40, 35, 30)
-        speaker_color = (180, 168, 145)
+        self.screen.blit(self._script_panel(box_rect.w, box_rect.h), box_rect.topleft)
         y = box_y + padding
-        if speaker_text:
-            s_shadow = speaker_font.render(speaker_text, True, shadow_color)
-            s_surf = speaker_font.render(speaker_text, True, speaker_color)
-            self.screen.blit(s_shadow, (box_x + padding + 1, y + 1))
-            self.screen.blit(s_surf, (box_x + padding, y))
-            y += speaker_font.get_height() + 6
-        for i, line in enumerate(wrapped):
-            shadow = font.render(line, True, shadow_color)
-            surf = font.render(line, True, text_color)
-            self.screen.blit(shadow, (box_x + padding + 1, y + 1))
-            self.screen.blit(surf, (box_x + padding, y))
+        if speaker_chars:
+            # Full-length renders are made once per script line; the typed prefix is a clip of them
+            clip = (0, 0, speaker_offsets[speaker_chars], speaker_h)
+            shadow, text = renders[0]
+            self.screen.blit(shadow, (box_x + padding + 1, y + 1), clip)
+            self.screen.blit(text, (box_x + padding, y), clip)
+            y += speaker_h + 6
+        for (shadow, text), width in shown:
+            clip = (0, 0, width, text_h)
+            self.screen.blit(shadow, (box_x + padding + 1, y + 1), clip)
+            self.screen.blit(text, (box_x + padding, y), clip)
             y += line_height
 
+    def _draw_opening_text_box(self) -> None:
+        """Draw the current opening slide text box at bottom with typing effect. Format: 'Speaker\\nDialogue'."""
+        slide_idx = self.opening_slide_index
+        if slide_idx >= len(OPENING_SCRIPT) or self.opening_text_index >= len(OPENING_SCRIPT[slide_idx]):
+            return
+        self._draw_script_box(OPENING_SCRIPT[slide_idx][self.opening_text_index], self.opening_char_index, 200)
+
     def draw_opening(self) -> None:
         self.screen.fill((0, 0, 0))
         if not self.opening_images or self.opening_slide_index >= len(self.opening_images):
             return
-        img = self.opening_images[self.opening_slide_index]
+        img = self._opening_image(self.opening_slide_index)
         if self.opening_phase == "fade_in":
             alpha = min(255, int(255 * self.opening_timer / self.OPENING_FADE_IN_DURATION))
         elif self.opening_phase == "holding":
@@ -1681,15 +2295,22 @@ class VanishingMemoriesGame:
         self.screen.blit(img, (0, 0))
         if self.opening_phase == "holding":
             self._draw_opening_text_box()
-            hint = self.small_font.render("RIGHT ARROW to continue  ·  ESC to skip", True, (140, 145, 155))
+            hint = self._render_text(self.small_font, "RIGHT ARROW to continue  ·  ESC to skip", (140, 145, 155))
             self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, self.HEIGHT - hint.get_height() - 16))
 
     # ---------- Draw: Ending sequence ----------
     def _ending_memory_rects(self) -> List[Tuple[pygame.Rect, int]]:
-        """Return [(rect, snapshot_index), ...] for the memories row (one per crystallized snapshot)."""
+        """Return [(rect, snapshot_index), ...] for the memories row (one per crystallized snapshot).
+
+        The row only depends on the snapshot count, so it is laid out once per count and shared
+        by draw_ending and the click handler; callers must not modify the rects.
+        """
         if not self.snapshots:
             return []
-        rects = []
+        rects = self._ending_memory_rows.get(len(self.snapshots))
+        if rects is not None:
+            return rects
+        rects = self._ending_memory_rows[len(self.snapshots)] = []
         thumb_w, thumb_h = 100, 75
         row_y = self.HEIGHT - thumb_h - 50
         total_w = len(self.snapshots) * (thumb_w + 24) - 24
@@ -1709,23 +2330,9 @@ class VanishingMemoriesGame:
         fn = (snap.trigger_artifact_filename or "").strip()
         if not fn:
             return
-        root = os.path.dirname(os.path.abspath(__file__))
-        fn_lower = fn.lower()
-        if fn_lower.startswith("r") and fn_lower.endswith(".png") and fn_lower[1:-4].isdigit():
-            path = os.path.join(root, "replacements", fn)
-        else:
-            scene_index = next((i for i, sc in enumerate(self.scenes) if sc.label == snap.scene_label), 0)
-            subfolder = f"s{scene_index + 1}"
-            path = os.path.join(root, "scenes", subfolder, fn)
+        scene_index = self.SCENE_LABELS.index(snap.scene_label) if snap.scene_label in self.SCENE_LABELS else 0
         try:
-            img = pygame.image.load(path).convert_alpha()
-            max_side = 200
-            w, h = img.get_width(), img.get_height()
-            if w > h:
-                w, h = (max_side, max(1, int(h * max_side / w))) if w > max_side else (w, h)
-            else:
-                w, h = (max(1, int(w * max_side / h)), max_side) if h > max_side else (w, h)
-            self.popup_artifact_surface = pygame.transform.smoothscale(img, (w, h))
+            self.popup_artifact_surface = load_scaled(self._artifact_path(scene_index, fn), max_side=200)
         except (pygame.error, FileNotFoundError):
             pass
 
@@ -1750,17 +2357,15 @@ class VanishingMemoriesGame:
         info = ARTIFACT_INFO.get(self.popup_artifact_filename)
         if not info:
             return
-        box_w, box_h = 520, 380
-        box_x = (self.WIDTH - box_w) // 2
-        box_y = (self.HEIGHT - box_h) // 2
+        box_x, box_y, box_w, box_h = self._memory_popup_box_rect
         margin = 24
         pygame.draw.rect(self.screen, (48, 42, 35), (box_x, box_y, box_w, box_h), border_radius=8)
         pygame.draw.rect(self.screen, (95, 75, 52), (box_x, box_y, box_w, box_h), 3, border_radius=8)
-        x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
+        x_btn = self._memory_popup_x_btn
         pygame.draw.rect(self.screen, (68, 52, 38), x_btn)
         pygame.draw.line(self.screen, (180, 160, 120), (x_btn.left + 7, x_btn.top + 7), (x_btn.right - 7, x_btn.bottom - 7), 2)
         pygame.draw.line(self.screen, (180, 160, 120), (x_btn.right - 7, x_btn.top + 7), (x_btn.left + 7, x_btn.bottom - 7), 2)
-        title_surf = self.popup_title_font.render(info["name"], True, (228, 212, 180))
+        title_surf = self._render_text(self.popup_title_font, info["name"], (228, 212, 180))
         self.screen.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 18))
         img_area_w, img_area_h = 200, 220
         img_area_x, img_area_y = box_x + margin + 12, box_y + 54
@@ -1777,24 +2382,11 @@ class VanishingMemoriesGame:
         desc_x = box_x + margin + 12 + img_area_w + 16
         desc = info["description"]
         max_line_w = box_w - (desc_x - box_x) - 24
-        words, lines, line = desc.split(), [], []
-        for word in words:
-            test = " ".join(line + [word])
-            if self.popup_text_font.size(test)[0] <= max_line_w:
-                line.append(word)
-            else:
-                if line:
-                    lines.append(" ".join(line))
-                line = [word]
-        if line:
-            lines.append(" ".join(line))
-        y_desc = box_y + 78
-        lh = self.popup_text_font.get_height() + 3
-        for i, ln in enumerate(lines):
-            if y_desc + (i + 1) * lh > box_y + box_h - 50:
-                break
-            self.screen.blit(self.popup_text_font.render(ln, True, (210, 195, 165)), (desc_x, y_desc + i * lh))
-        close_hint = self.popup_small_font.render("Close (X)", True, (165, 145, 110))
+        self._batch_blit(self._text_block_blits(
+            self.popup_text_font, desc, max_line_w, (desc_x, box_y + 78), self._popup_line_height,
+            box_y + box_h - 50, (((210, 195, 165), 0),),
+        ))
+        close_hint = self._render_text(self.popup_small_font, "Close (X)", (165, 145, 110))
         self.screen.blit(close_hint, (box_x + box_w - 24 - close_hint.get_width(), box_y + box_h - 36))
 
     def _draw_ending_text_box(self) -> None:
@@ -1802,65 +2394,18 @@ class VanishingMemoriesGame:
         if self.ending_index >= len(self.ending_slides):
             return
         slide = self.ending_slides[self.ending_index]
-        script = slide.get("script", [])
+        script = slide.script
         if not script or self.ending_text_index >= len(script):
             return
-        full_text = script[self.ending_text_index]
-        display_text = full_text[: self.ending_char_index]
-        font = self.popup_text_font
-        speaker_font = self.popup_small_font
-        box_margin_x = 80
-        box_margin_bottom = 52
-        box_max_width = self.WIDTH - 2 * box_margin_x
-        line_height = font.get_height() + 4
-        padding = 20
-        if "\n" in display_text:
-            speaker_text, dialogue_text = display_text.split("\n", 1)
-        else:
-            speaker_text = display_text if display_text else ""
-            dialogue_text = ""
-        wrapped = self._wrap_opening_text(dialogue_text, font, box_max_width - 48) if dialogue_text else []
-        speaker_height = (speaker_font.get_height() + 2) if speaker_text else 0
-        if speaker_text:
-            speaker_height += 4
-        box_h = speaker_height + (len(wrapped) * line_height + 2 * padding) if wrapped else (line_height + 2 * padding)
-        box_h = min(max(box_h, 80), 220)
-        box_margin_top = 52
-        if slide.get("show_memories"):
-            box_y = box_margin_top
-        else:
-            box_y = self.HEIGHT - box_h - box_margin_bottom
-        box_x = (self.WIDTH - box_max_width) // 2
-        box_rect = pygame.Rect(box_x, box_y, box_max_width, box_h)
-        panel = pygame.Surface((box_rect.w, box_rect.h), pygame.SRCALPHA)
-        panel.fill((18, 16, 22, 220))
-        pygame.draw.rect(panel, (80, 70, 55, 180), (0, 0, box_rect.w, box_rect.h), 2, border_radius=8)
-        pygame.draw.rect(panel, (120, 105, 75, 120), (0, 0, box_rect.w, box_rect.h), 1, border_radius=8)
-        self.screen.blit(panel, box_rect.topleft)
-        text_color = (232, 225, 210)
-        shadow_color = (40, 35, 30)
-        speaker_color = (180, 168, 145)
-        y = box_y + padding
-        if speaker_text:
-            s_shadow = speaker_font.render(speaker_text, True, shadow_color)
-            s_surf = speaker_font.render(speaker_text, True, speaker_color)
-            self.screen.blit(s_shadow, (box_x + padding + 1, y + 1))
-            self.screen.blit(s_surf, (box_x + padding, y))
-            y += speaker_font.get_height() + 6
-        for i, line in enumerate(wrapped):
-            shadow = font.render(line, True, shadow_color)
-            surf = font.render(line, True, text_color)
-            self.screen.blit(shadow, (box_x + padding + 1, y + 1))
-            self.screen.blit(surf, (box_x + padding, y))
-            y += line_height
+        self._draw_script_box(script[self.ending_text_index], self.ending_char_index, 220, at_top=slide.show_memories)
 
     def draw_ending(self) -> None:
         self.screen.fill((0, 0, 0))
         if self.ending_index >= len(self.ending_slides):
             return
         slide = self.ending_slides[self.ending_index]
-        script = slide.get("script", [])
-        img_name = slide.get("image")
+        script = slide.script
+        img_name = slide.image
         if img_name:
             surf = self._load_ending_image(img_name)
             if self.ending_phase == "fade_in":
@@ -1871,41 +2416,33 @@ class VanishingMemoriesGame:
                 alpha = max(0, int(255 * (1.0 - self.ending_timer / self.ENDING_FADE_OUT)))
             surf.set_alpha(alpha)
             self.screen.blit(surf, (0, 0))
-        show_memories = slide.get("show_memories") and len(self.snapshots) > 0
+        show_memories = slide.show_memories and len(self.snapshots) > 0
         if show_memories:
-            thumb_w, thumb_h = 100, 75
-            row_y = self.HEIGHT - thumb_h - 50
-            total_w = len(self.snapshots) * (thumb_w + 24) - 24
-            start_x = (self.WIDTH - total_w) // 2
-            for i, snap in enumerate(self.snapshots):
-                px = start_x + i * (thumb_w + 24)
-                rect = pygame.Rect(px, row_y, thumb_w + 20, thumb_h + 24)
+            pairs = self._blit_pairs
+            pairs.clear()
+            for rect, i in self._ending_memory_rects():
                 tilt = (-5 + (i % 3) * 5) * (math.pi / 180)
-                draw_polaroid_frame(
-                    self.screen, rect,
-                    pygame.transform.smoothscale(snap.surface, (thumb_w, thumb_h)),
-                    tilt=tilt * 10,
-                )
+                pairs.extend(self._snapshot_polaroid_blits(self.snapshots[i], rect, (100, 75), tilt * 10))
+            self._batch_blit(pairs)
         if script and self.ending_text_index < len(script):
             self._draw_ending_text_box()
-            if not slide.get("accept_123"):
-                hint = self.small_font.render("RIGHT ARROW to continue", True, (140, 145, 155))
+            if not slide.accept_123:
+                hint = self._render_text(self.small_font, "RIGHT ARROW to continue", (140, 145, 155))
                 self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, self.HEIGHT - 28))
             else:
-                choose_hint = self.small_font.render("Press 1 (Goblin), 2 (Chef), or 3 (Queen) to choose", True, (140, 145, 155))
+                choose_hint = self._render_text(self.small_font, "Press 1 (Goblin), 2 (Chef), or 3 (Queen) to choose", (140, 145, 155))
                 self.screen.blit(choose_hint, (self.WIDTH // 2 - choose_hint.get_width() // 2, self.HEIGHT - 28))
-        elif slide.get("exit_prompt") and (not script or self.ending_text_index >= len(script)):
-            hint = self.text_font.render("Click or press a key to exit", True, (200, 205, 220))
+        elif slide.exit_prompt and (not script or self.ending_text_index >= len(script)):
+            hint = self._render_text(self.text_font, "Click or press a key to exit", (200, 205, 220))
             self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, self.HEIGHT - 42))
             # Music credit (Yakov Golman, Free Music Archive, CC BY)
-            credit_font = pygame.font.SysFont("arial", 11)
-            credit = credit_font.render("Music: Yakov Golman (Free Music Archive, CC BY)", True, (100, 105, 110))
+            credit = self._render_text(self.credit_font, "Music: Yakov Golman (Free Music Archive, CC BY)", (100, 105, 110))
             self.screen.blit(credit, (self.WIDTH // 2 - credit.get_width() // 2, self.HEIGHT - 20))
-        elif self.ending_phase == "holding" and not slide.get("accept_123") and not script:
-            hint = self.small_font.render("RIGHT ARROW to continue", True, (140, 145, 155))
+        elif self.ending_phase == "holding" and not slide.accept_123 and not script:
+            hint = self._render_text(self.small_font, "RIGHT ARROW to continue", (140, 145, 155))
             self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, self.HEIGHT - 28))
-        elif slide.get("accept_123"):
-            hint = self.small_font.render("Press 1 (Goblin), 2 (Chef), or 3 (Queen) to choose", True, (140, 145, 155))
+        elif slide.accept_123:
+            hint = self._render_text(self.small_font, "Press 1 (Goblin), 2 (Chef), or 3 (Queen) to choose", (140, 145, 155))
             self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, self.HEIGHT - 28))
         if self.ending_memory_popup_index >= 0:
             self._draw_ending_artifact_popup()
@@ -1918,8 +2455,6 @@ class VanishingMemoriesGame:
         if self.current_scene_index < 0:
             return
         scene = self.scenes[self.current_scene_index]
-        t = self.scene_time
-        px, py = int(self.parallax_offset[0]), int(self.parallax_offset[1])
         shake_x, shake_y = int(self.camera_shake[0]), int(self.camera_shake[1])
 
         # Background (s1–s6 image or gradient fallback)
@@ -1927,60 +2462,41 @@ class VanishingMemoriesGame:
         fade = self.scene_fade_progress[self.current_scene_index] if 0 <= self.current_scene_index < len(self.scene_fade_progress) else 0.0
         if fade > 0.02:
             # Fade + blur: scale down then up for soft blur, then dull overlay
-            scale = 1.0 - 0.45 * fade
+            scale = 1.0 - 0.45 * math.ceil(fade * self.BLUR_STEPS) / self.BLUR_STEPS
             if scale < 0.55:
                 scale = 0.55
             bw, bh = bg.get_width(), bg.get_height()
-            small_w = max(1, int(bw * scale))
-            small_h = max(1, int(bh * scale))
-            blurred = pygame.transform.smoothscale(bg, (small_w, small_h))
-            blurred = pygame.transform.smoothscale(blurred, (bw, bh))
-            self.screen.blit(blurred, (0, 0))
+            small = (max(1, int(bw * scale)), max(1, int(bh * scale)))
+            if scene.blurred is None or scene.blurred[0] != small:
+                scene.blurred = (small, pygame.transform.smoothscale(pygame.transform.smoothscale(bg, small), (bw, bh)))
+            self.screen.blit(scene.blurred[1], (0, 0))
         else:
             self.screen.blit(bg, (0, 0))
-        # Artifacts: draw before dull overlay so they fade at same rate as background; track rects for hover
-        ox, oy, bw, bh = scene.bg_rect
-        artifact_rects = []
-        for art in scene.artifacts:
-            cx = ox + int(art.frac_x * bw)
-            cy = oy + int(art.frac_y * bh)
-            sw, sh = art.surface.get_width(), art.surface.get_height()
-            dx = cx - sw // 2 + shake_x + int(art.offset_x_aw * sw)
-            dy = cy - sh // 2 + shake_y + int(art.offset_y_ah * sh)
-            artifact_rects.append(pygame.Rect(dx, dy, sw, sh))
-            if art.darken < 1.0:
-                temp = pygame.Surface((sw, sh), pygame.SRCALPHA)
-                temp.blit(art.surface, (0, 0))
-                dark = pygame.Surface((sw, sh))
-                v = int(255 * art.darken)
-                dark.fill((v, v, v))
-                temp.blit(dark, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                self.screen.blit(temp, (dx, dy))
-            else:
-                self.screen.blit(art.surface, (dx, dy))
-        # Hover highlight: lighten hovered artifact (same style as clock menu)
-        mx, my = pygame.mouse.get_pos()
-        hovered_idx = next((i for i, r in enumerate(artifact_rects) if r.collidepoint(mx, my)), -1)
+        # Artifacts: draw before dull overlay so they fade at same rate as background.
+        # Placement is precomputed per scene (artifact_rects); only the shake moves them.
+        if shake_x or shake_y:
+            pairs = self._blit_pairs
+            pairs.clear()
+            for surf, (dx, dy) in scene.artifact_blits:
+                pairs.append((surf, (dx + shake_x, dy + shake_y)))
+            self._batch_blit(pairs)
+        else:
+            self._batch_blit(scene.artifact_blits)
+        # Hover highlight: lighten hovered artifact (same style as clock menu); same hit test as clicks
+        hovered_idx = self._get_artifact_index_at_pos(pygame.mouse.get_pos())
         if hovered_idx >= 0:
             art = scene.artifacts[hovered_idx]
-            r = artifact_rects[hovered_idx]
-            lighten = art.surface.copy()
-            lighten.set_alpha(70)
-            self.screen.blit(lighten, r.topleft, special_flags=pygame.BLEND_RGBA_ADD)
+            r = scene.artifact_rects[hovered_idx]
+            if art.highlight_surface is None:
+                art.highlight_surface = art.surface.copy()
+                art.highlight_surface.set_alpha(70)
+            self.screen.blit(art.highlight_surface, (r.x + shake_x, r.y + shake_y), special_flags=pygame.BLEND_RGBA_ADD)
         # Cursor: pointer when hovering over an artifact (clickable), arrow otherwise
-        try:
-            if hovered_idx >= 0:
-                pygame.mouse.set_cursor(pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_HAND))
-            else:
-                pygame.mouse.set_cursor(pygame.cursors.Cursor(pygame.SYSTEM_CURSOR_ARROW))
-        except (AttributeError, TypeError):
-            pass
+        self._set_cursor(pygame.SYSTEM_CURSOR_HAND if hovered_idx >= 0 else pygame.SYSTEM_CURSOR_ARROW)
         # Dull overlay: fades/dulls the scene (no blackening), same rate for bg and artifacts
         if fade > 0:
-            dull = pygame.Surface((self.WIDTH, self.SCENE_HEIGHT), pygame.SRCALPHA)
             alpha = int(fade * 248)
-            dull.fill((238, 240, 245))
-            dull.set_alpha(min(255, alpha))
+            dull = _overlay_surface((self.WIDTH, self.SCENE_HEIGHT), (238, 240, 245), min(255, alpha))
             self.screen.blit(dull, (0, 0))
         # Light vignette
         draw_vignette_fast(self.screen.subsurface((0, 0, self.WIDTH, self.SCENE_HEIGHT)), 0.15)
@@ -1990,61 +2506,29 @@ class VanishingMemoriesGame:
         panel_h = self.HEIGHT - panel_y
         pygame.draw.rect(self.screen, (22, 28, 42), (0, panel_y, self.WIDTH, panel_h))
         pygame.draw.line(self.screen, (50, 60, 90), (0, panel_y), (self.WIDTH, panel_y), 1)
-        hint = self.small_font.render(
+        hint = self._render_text(
+            self.small_font,
             f"  {scene.label}  ·  S: snapshot ({len(self.snapshots)}/{self.MAX_SNAPSHOTS})  ·  ESC: back to clocks",
-            True, (180, 190, 210)
+            (180, 190, 210),
         )
         self.screen.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, panel_y + (panel_h - hint.get_height()) // 2))
 
     # ---------- Artifact popup (medieval textbox) ----------
-    def _draw_artifact_popup(self) -> None:
+    def _draw_artifact_popup(self, backdrop: bool = True) -> None:
         info = ARTIFACT_INFO.get(self.popup_artifact_filename)
         if not info:
             return
-        box_w, box_h = 520, 440
-        box_x = (self.WIDTH - box_w) // 2
-        box_y = (self.SCENE_HEIGHT - box_h) // 2
-        # Dark overlay
-        overlay = pygame.Surface((self.WIDTH, self.SCENE_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
-        self.screen.blit(overlay, (0, 0))
-        # Medieval frame: outer shadow/dark band
+        box_x, box_y, box_w, box_h = self._popup_box_rect
+        # Dark overlay (skipped when only the box is repainted over an already-dimmed frame)
+        if backdrop:
+            self.screen.blit(_overlay_surface((self.WIDTH, self.SCENE_HEIGHT), (0, 0, 0, 170)), (0, 0))
+        # Dark frame band, parchment, flourishes and X button, pre-drawn in _init_popup_layout
         margin = 12
-        pygame.draw.rect(self.screen, (35, 28, 22), (box_x - 2, box_y - 2, box_w + 4, box_h + 4))
-        # Outer border (dark wood / iron)
-        pygame.draw.rect(self.screen, (55, 42, 32), (box_x, box_y, box_w, box_h), 4)
-        # Inner margin band (lighter)
-        pygame.draw.rect(self.screen, (75, 58, 42), (box_x + 4, box_y + 4, box_w - 8, box_h - 8), 2)
-        # Parchment fill with gradient (darker edges)
-        inner_h = box_h - 2 * margin
-        for dy in range(inner_h):
-            t = dy / max(1, inner_h)
-            edge = min(dy, inner_h - 1 - dy, margin * 2) / (margin * 2) if margin else 1.0
-            r = int(72 + 18 * (1 - t) + 12 * (1 - edge))
-            g = int(58 + 14 * (1 - t) + 10 * (1 - edge))
-            b = int(42 + 10 * (1 - t) + 8 * (1 - edge))
-            r, g, b = max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
-            pygame.draw.line(self.screen, (r, g, b), (box_x + margin, box_y + margin + dy), (box_x + box_w - margin - 1, box_y + margin + dy))
-        # Ornate corner flourishes (L-shaped)
-        flourish_w = 20
-        fc = (100, 78, 55)
-        for (cx, cy), (dx, dy) in [((box_x, box_y), (1, 1)), ((box_x + box_w, box_y), (-1, 1)), ((box_x + box_w, box_y + box_h), (-1, -1)), ((box_x, box_y + box_h), (1, -1))]:
-            pygame.draw.line(self.screen, fc, (cx, cy + 8), (cx, cy + flourish_w * dy), 2)
-            pygame.draw.line(self.screen, fc, (cx + 8 * dx, cy), (cx + flourish_w * dx, cy), 2)
-            pygame.draw.line(self.screen, (130, 100, 72), (cx + 2 * dx, cy + 2 * dy), (cx + 6 * dx, cy + 6 * dy), 1)
-        # Top/bottom decorative double line
-        pygame.draw.line(self.screen, (90, 70, 50), (box_x + 28, box_y + 44), (box_x + box_w - 28, box_y + 44), 1)
-        pygame.draw.line(self.screen, (110, 85, 60), (box_x + 28, box_y + 46), (box_x + box_w - 28, box_y + 46), 1)
-        # X close button (engraved look)
-        x_btn = pygame.Rect(box_x + box_w - 36, box_y + 8, 28, 28)
-        pygame.draw.rect(self.screen, (58, 45, 35), x_btn)
-        pygame.draw.rect(self.screen, (95, 75, 52), x_btn, 2)
-        pygame.draw.line(self.screen, (180, 160, 120), (x_btn.left + 7, x_btn.top + 7), (x_btn.right - 7, x_btn.bottom - 7), 2)
-        pygame.draw.line(self.screen, (180, 160, 120), (x_btn.right - 7, x_btn.top + 7), (x_btn.left + 7, x_btn.bottom - 7), 2)
+        self.screen.blit(self._popup_chrome, (box_x - 2, box_y - 2))
         # Title (artifact name) — serif, slight shadow
-        title_surf = self.popup_title_font.render(info["name"], True, (45, 38, 28))
+        title_surf = self._render_text(self.popup_title_font, info["name"], (45, 38, 28))
         self.screen.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2 + 1, box_y + 18 + 1))
-        title_surf = self.popup_title_font.render(info["name"], True, (228, 212, 180))
+        title_surf = self._render_text(self.popup_title_font, info["name"], (228, 212, 180))
         self.screen.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 18))
         # Artifact image (larger version) on the left
         img_area_w, img_area_h = 200, 220
@@ -2071,55 +2555,28 @@ class VanishingMemoriesGame:
                 self.screen.blit(surf, (dx, dy))
         # "Description" label and text to the right of the image
         desc_x = box_x + margin + 12 + img_area_w + 16
-        desc_label = self.popup_small_font.render("Description", True, (160, 140, 105))
+        desc_label = self._render_text(self.popup_small_font, "Description", (160, 140, 105))
         self.screen.blit(desc_label, (desc_x, box_y + 54))
         pygame.draw.line(self.screen, (100, 82, 58), (desc_x, box_y + 54 + desc_label.get_height() + 2), (desc_x + desc_label.get_width(), box_y + 54 + desc_label.get_height() + 2), 1)
         # Description text (wrapped, serif)
         desc = info["description"]
         max_line_w = box_w - (desc_x - box_x) - 24
-        words = desc.split()
-        lines = []
-        line = []
-        for word in words:
-            test = " ".join(line + [word])
-            if self.popup_text_font.size(test)[0] <= max_line_w:
-                line.append(word)
-            else:
-                if line:
-                    lines.append(" ".join(line))
-                line = [word]
-        if line:
-            lines.append(" ".join(line))
-        y_desc = box_y + 78
-        line_height = self.popup_text_font.get_height() + 3
-        for i, ln in enumerate(lines):
-            if y_desc + (i + 1) * line_height > box_y + box_h - 118:
-                break
-            shadow = self.popup_text_font.render(ln, True, (50, 42, 32))
-            self.screen.blit(shadow, (desc_x + 1, y_desc + i * line_height + 1))
-            surf = self.popup_text_font.render(ln, True, (210, 195, 165))
-            self.screen.blit(surf, (desc_x, y_desc + i * line_height))
+        self._batch_blit(self._text_block_blits(
+            self.popup_text_font, desc, max_line_w, (desc_x, box_y + 78), self._popup_line_height,
+            box_y + box_h - 118, (((50, 42, 32), 1), ((210, 195, 165), 0)),
+        ))
         # Crystallizations (serif, ornamental)
         used = len(self.snapshots)
         remain = self.MAX_SNAPSHOTS - used
-        cryst_text = self.popup_small_font.render(
+        cryst_text = self._render_text(
+            self.popup_small_font,
             f"  {used} of {self.MAX_SNAPSHOTS} crystallizations used   ·   {remain} remaining  ",
-            True, (165, 145, 110)
+            (165, 145, 110),
         )
         self.screen.blit(cryst_text, (box_x + (box_w - cryst_text.get_width()) // 2, box_y + box_h - 98))
         # Buttons: Crystallize when < 3 (can use multiple from same scene); Uncrystallize only from the artifact that triggered it
-        btn_y = box_y + box_h - 56
-        btn_h = 40
-        scene = self.scenes[self.popup_scene_index] if self.popup_scene_index >= 0 else None
-        can_uncrystallize_here = bool(
-            scene and any(
-                s.scene_label == scene.label and (s.trigger_artifact_filename is None or s.trigger_artifact_filename == self.popup_artifact_filename)
-                for s in self.snapshots
-            )
-        )
-        cryst_btn = pygame.Rect(box_x + 24, btn_y, 160, btn_h)
-        uncryst_btn = pygame.Rect(box_x + 24 + 164, btn_y, 130, btn_h)
-        close_btn = pygame.Rect(box_x + box_w - 24 - 100, btn_y, 100, btn_h)
+        can_uncrystallize_here = self._can_uncrystallize_here()
+        cryst_btn, uncryst_btn, close_btn = self._popup_cryst_btn, self._popup_uncryst_btn, self._popup_close_btn
         buttons = []
         if len(self.snapshots) < self.MAX_SNAPSHOTS:
             buttons.append((cryst_btn, "Crystallize memory"))
@@ -2136,7 +2593,7 @@ class VanishingMemoriesGame:
             pygame.draw.line(self.screen, (45, 35, 25), btn_rect.topright, btn_rect.bottomright, 2)
             pygame.draw.rect(self.screen, (88, 68, 48), btn_rect.inflate(-4, -4), 1)
             color = (180, 170, 150) if label == "Crystallize memory (full)" else (225, 210, 178)
-            lbl_surf = self.popup_small_font.render(label, True, color)
+            lbl_surf = self._render_text(self.popup_small_font, label, color)
             self.screen.blit(lbl_surf, (btn_rect.centerx - lbl_surf.get_width() // 2, btn_rect.centery - lbl_surf.get_height() // 2))
 
     # ---------- Snapshot effect (freeze, flash, desaturate) ----------
@@ -2145,71 +2602,50 @@ class VanishingMemoriesGame:
             return
         self.screen.blit(self.snapshot_freeze_surface, (0, 0))
         # Desaturate briefly
-        desat = pygame.Surface(self.snapshot_freeze_surface.get_size(), pygame.SRCALPHA)
-        desat.fill((180, 180, 180, 60))
+        desat = _overlay_surface(self.snapshot_freeze_surface.get_size(), (180, 180, 180, 60))
         self.screen.blit(desat, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         # White flash
         if self.snapshot_flash_alpha > 0:
-            flash = pygame.Surface((self.WIDTH, self.SCENE_HEIGHT), pygame.SRCALPHA)
-            flash.fill((255, 255, 255, self.snapshot_flash_alpha))
+            flash = _overlay_surface((self.WIDTH, self.SCENE_HEIGHT), (255, 255, 255), int(self.snapshot_flash_alpha))
             self.screen.blit(flash, (0, 0))
 
     # ---------- Draw: Accusation ----------
     def draw_accuse(self) -> None:
         t = self._time_accum
-        for y in range(self.HEIGHT):
-            v = y / self.HEIGHT
-            r, g, b = int(8 + 12 * (1 - v)), int(12 + 18 * (1 - v)), int(28 + 25 * (1 - v))
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.WIDTH, y))
-        draw_vignette_fast(self.screen, 0.5)
+        if self._accuse_bg is None:
+            # Static backdrop: vertical gradient (1-px column stretched across) with the vignette baked in
+            column = pygame.Surface((1, self.HEIGHT))
+            for y in range(self.HEIGHT):
+                v = y / self.HEIGHT
+                column.set_at((0, y), (int(8 + 12 * (1 - v)), int(12 + 18 * (1 - v)), int(28 + 25 * (1 - v))))
+            self._accuse_bg = pygame.transform.scale(column, (self.WIDTH, self.HEIGHT))
+            draw_vignette_fast(self._accuse_bg, 0.5)
+        self.screen.blit(self._accuse_bg, (0, 0))
         draw_glitch_overlay(self.screen, 0.1, t)
 
-        title = self.title_font.render("Make Your Accusation", True, (230, 235, 245))
+        title = self._render_text(self.title_font, "Make Your Accusation", (230, 235, 245))
         self.screen.blit(title, (self.WIDTH // 2 - title.get_width() // 2, 22))
-        inst = self.text_font.render("Crystallize at least 12 points of evidence for your chosen suspect. Click to accuse.", True, (190, 198, 210))
+        inst = self._render_text(self.text_font, "Crystallize at least 12 points of evidence for your chosen suspect. Click to accuse.", (190, 198, 210))
         self.screen.blit(inst, (self.WIDTH // 2 - inst.get_width() // 2, 68))
 
-        total_queen = sum(s.points_queen for s in self.snapshots)
-        total_chef = sum(s.points_chef for s in self.snapshots)
-        total_goblin = sum(s.points_goblin for s in self.snapshots)
-        pts_line = self.small_font.render(f"Evidence: Queen {total_queen} pts  ·  Chef {total_chef} pts  ·  Goblin {total_goblin} pts", True, (170, 178, 195))
+        total_queen, total_chef, total_goblin = self._totals["queen"], self._totals["chef"], self._totals["goblin"]
+        pts_line = self._render_text(self.small_font, f"Evidence: Queen {total_queen} pts  ·  Chef {total_chef} pts  ·  Goblin {total_goblin} pts", (170, 178, 195))
         self.screen.blit(pts_line, (self.WIDTH // 2 - pts_line.get_width() // 2, 96))
 
         card_w, card_h = 260, 115
         margin_x, margin_y = 60, 180
         spacing_y = 125
+        grain = int(t * self.GRAIN_FPS) % self.GRAIN_FRAMES
         for idx, s in enumerate(self.suspects):
             x, y = margin_x, margin_y + idx * spacing_y
             hover = self.hover_suspect_index == idx
             # Dossier card with paper texture (noise) and lift
             lift = ease_out_quad(min(1.0, 0.3 + 0.15 * math.sin(t + idx))) if hover else 0
             draw_y = int(y - lift * 6)
-            rect = pygame.Rect(x, draw_y, card_w, card_h)
-            # Shadow
-            shadow_r = pygame.Rect(x + 5, draw_y + 5, card_w, card_h)
-            shadow = pygame.Surface((card_w + 10, card_h + 10), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0, 0, 0, 70), (5, 5, card_w, card_h), border_radius=6)
-            self.screen.blit(shadow, (x - 2, draw_y - 2))
-            # Paper colour with slight variation (dossier)
-            paper = (38, 42, 58) if not hover else (45, 50, 68)
-            pygame.draw.rect(self.screen, paper, rect, border_radius=6)
-            # Red outline when selected (we don't have selection until click, so use hover)
-            border_color = (180, 80, 80) if hover else (70, 95, 140)
-            border_w = 3 if hover else 1
-            pygame.draw.rect(self.screen, border_color, rect, border_w, border_radius=6)
-            # Paper texture (light noise)
-            for _ in range(80):
-                nx = x + random.randint(0, card_w - 1)
-                ny = draw_y + random.randint(0, card_h - 1)
-                self.screen.set_at((nx, ny), (50, 55, 75))
-            name = self.text_font.render(s.name, True, (235, 238, 248))
-            role = self.small_font.render(s.role, True, (180, 188, 205))
-            pts = total_queen if s.id == "queen" else (total_chef if s.id == "chef" else total_goblin)
-            motive = self.small_font.render(f"Motive: {s.motive}", True, (170, 178, 195))
-            pts_str = self.small_font.render(f"Your evidence: {pts} pts", True, (150, 200, 180) if pts >= EVIDENCE_POINTS_REQUIRED else (170, 178, 195))
-            self.screen.blit(name, (x + 14, draw_y + 10))
-            self.screen.blit(role, (x + 14, draw_y + 34))
-            self.screen.blit(motive, (x + 14, draw_y + 56))
+            self.screen.blit(self._accuse_card_shadow(card_w, card_h), (x - 2, draw_y - 2))
+            self.screen.blit(self._accuse_card(idx, hover, grain, card_w, card_h), (x, draw_y))
+            pts = self._totals[s.id]
+            pts_str = self._render_text(self.small_font, f"Your evidence: {pts} pts", (150, 200, 180) if pts >= EVIDENCE_POINTS_REQUIRED else (170, 178, 195))
             self.screen.blit(pts_str, (x + 14, draw_y + 80))
 
         # Evidence board
@@ -2218,27 +2654,56 @@ class VanishingMemoriesGame:
         board_rect = pygame.Rect(ref_x, ref_y, ref_w, ref_h)
         pygame.draw.rect(self.screen, (22, 28, 45), board_rect, border_radius=8)
         pygame.draw.rect(self.screen, (60, 85, 130), board_rect, 2, border_radius=8)
-        ref_title = self.text_font.render("Evidence Board", True, (230, 235, 245))
+        ref_title = self._render_text(self.text_font, "Evidence Board", (230, 235, 245))
         self.screen.blit(ref_title, (ref_x + 14, ref_y + 12))
         line_y = ref_y + 44
         for i, snap in enumerate(self.snapshots):
             tags_str = ", ".join(sorted(set(snap.tags)))
-            line = self.small_font.render(f"{i + 1}. {snap.scene_label}: {tags_str}", True, (200, 208, 225))
+            line = self._render_text(self.small_font, f"{i + 1}. {snap.scene_label}: {tags_str}", (200, 208, 225))
             self.screen.blit(line, (ref_x + 14, line_y))
             line_y += 24
 
         # Snapshot polaroids on the right
         polaroid_y = ref_y + ref_h + 20
         thumb_w, thumb_h = 100, 75
+        pairs = self._blit_pairs
+        pairs.clear()
         for i, snap in enumerate(self.snapshots):
             px = ref_x + i * (thumb_w + 30)
             tilt = (-5 + (i % 3) * 5) * (math.pi / 180)
             rect = pygame.Rect(px, polaroid_y, thumb_w + 20, thumb_h + 24)
-            draw_polaroid_frame(
-                self.screen, rect,
-                pygame.transform.smoothscale(snap.surface, (thumb_w, thumb_h)),
-                tilt=tilt * 10,
-            )
+            pairs.extend(self._snapshot_polaroid_blits(snap, rect, (thumb_w, thumb_h), tilt * 10))
+        self._batch_blit(pairs)
+
+    def _accuse_card_shadow(self, card_w: int, card_h: int) -> pygame.Surface:
+        """Soft drop shadow behind an accuse card (blit at card position - 2)."""
+        shadow = self._accuse_cards.get(("shadow", card_w, card_h))
+        if shadow is None:
+            shadow = self._accuse_cards[("shadow", card_w, card_h)] = pygame.Surface((card_w + 10, card_h + 10), pygame.SRCALPHA)
+            pygame.draw.rect(shadow, (0, 0, 0, 70), (5, 5, card_w, card_h), border_radius=6)
+        return shadow
+
+    def _accuse_card(self, idx: int, hover: bool, grain: int, card_w: int, card_h: int) -> pygame.Surface:
+        """Suspect dossier card without the evidence line: paper, border, grain frame, name, role and motive."""
+        key = (idx, hover, grain, card_w, card_h)
+        card = self._accuse_cards.get(key)
+        if card is None:
+            s = self.suspects[idx]
+            card = self._accuse_cards[key] = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+            rect = card.get_rect()
+            # Paper colour with slight variation (dossier)
+            paper = (38, 42, 58) if not hover else (45, 50, 68)
+            pygame.draw.rect(card, paper, rect, border_radius=6)
+            # Red outline when selected (we don't have selection until click, so use hover)
+            border_color = (180, 80, 80) if hover else (70, 95, 140)
+            border_w = 3 if hover else 1
+            pygame.draw.rect(card, border_color, rect, border_w, border_radius=6)
+            # Paper texture (light noise): one of GRAIN_FRAMES speck patterns, so the grain still shimmers
+            card.blit(speck_texture((card_w, card_h), 80, (50, 55, 75), idx * self.GRAIN_FRAMES + grain), (0, 0))
+            card.blit(self._render_text(self.text_font, s.name, (235, 238, 248)), (14, 10))
+            card.blit(self._render_text(self.small_font, s.role, (180, 188, 205)), (14, 34))
+            card.blit(self._render_text(self.small_font, f"Motive: {s.motive}", (170, 178, 195)), (14, 56))
+        return card
 
     # ---------- Draw: Result ----------
     def draw_result(self) -> None:
@@ -2251,7 +2716,10 @@ class VanishingMemoriesGame:
             draw_vignette_fast(self.screen, 0.4)
             big_text = "CASE CLOSED"
             alpha = min(255, int(200 + 55 * ease_out_quad(min(1.0, t * 1.5))))
-            title_surf = self.big_result_font.render(big_text, True, (120, 255, 160))
+            # Own copy rather than the shared _render_text entry: set_alpha mutates the surface
+            title_surf = self._case_closed_title
+            if title_surf is None:
+                title_surf = self._case_closed_title = self.big_result_font.render(big_text, True, (120, 255, 160))
             title_surf.set_alpha(alpha)
             self.screen.blit(
                 title_surf,
@@ -2262,12 +2730,11 @@ class VanishingMemoriesGame:
             glitch = 0.3 * math.sin(t * 15) * (1 if t < 0.5 else 0.5)
             self.screen.fill((25, 8, 8))
             draw_glitch_overlay(self.screen, 0.4 + glitch, t)
-            red_overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-            red_overlay.fill((120, 0, 0, int(80 * (0.5 + 0.5 * math.sin(t * 2)))))
-            self.screen.blit(red_overlay, (0, 0))
+            red_alpha = int(80 * (0.5 + 0.5 * math.sin(t * 2)))
+            self.screen.blit(_overlay_surface((self.WIDTH, self.HEIGHT), (120, 0, 0), red_alpha), (0, 0))
             draw_vignette_fast(self.screen, 0.6)
             big_text = "MEMORY COLLAPSED"
-            title_surf = self.big_result_font.render(big_text, True, (220, 80, 80))
+            title_surf = self._render_text(self.big_result_font, big_text, (220, 80, 80))
             self.screen.blit(
                 title_surf,
                 (self.WIDTH // 2 - title_surf.get_width() // 2, self.HEIGHT // 2 - 80),
@@ -2277,26 +2744,24 @@ class VanishingMemoriesGame:
             lines = self.result_message.split("\n")
             y = self.HEIGHT // 2 + 10
             for line in lines:
-                rendered = self.text_font.render(line, True, (210, 215, 225))
+                rendered = self._render_text(self.text_font, line, (210, 215, 225))
                 self.screen.blit(rendered, (60, y))
                 y += 28
 
         # Polaroid thumbnails
         thumb_w, thumb_h = 160, 105
+        pairs = self._blit_pairs
+        pairs.clear()
         for i, snap in enumerate(self.snapshots):
             px = 60 + i * (thumb_w + 40)
             py = self.HEIGHT - 140
             tilt = (-4 + i * 3) * (math.pi / 180)
             rect = pygame.Rect(px, py, thumb_w + 24, thumb_h + 28)
-            draw_polaroid_frame(
-                self.screen, rect,
-                pygame.transform.smoothscale(snap.surface, (thumb_w, thumb_h)),
-                tilt=tilt * 15,
-            )
-            lbl = self.small_font.render(snap.scene_label, True, (200, 205, 220))
-            self.screen.blit(lbl, (px, py + thumb_h + 32))
+            pairs.extend(self._snapshot_polaroid_blits(snap, rect, (thumb_w, thumb_h), tilt * 15))
+            pairs.append((self._render_text(self.small_font, snap.scene_label, (200, 205, 220)), (px, py + thumb_h + 32)))
+        self._batch_blit(pairs)
 
-        exit_msg = self.small_font.render("Click or press ESC to exit", True, (180, 185, 200))
+        exit_msg = self._render_text(self.small_font, "Click or press ESC to exit", (180, 185, 200))
         self.screen.blit(exit_msg, (60, self.HEIGHT - 28))
 
     # ---------- Main draw dispatcher (including snapshot effect state) ----------
@@ -2306,96 +2771,168 @@ class VanishingMemoriesGame:
             return
         self._draw_menu_impl()
 
+    def _menu_composite(self, dimmed: bool) -> pygame.Surface:
+        """Menu background with the six clocks blitted on (at alpha 140 once time is up); built once per variant."""
+        composite = self._menu_composites.get(dimmed)
+        if composite is None:
+            if self.menu_bg is not None:
+                composite = self.menu_bg.copy()
+            else:
+                composite = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+                composite.fill((18, 22, 35))
+                draw_vignette_fast(composite, 0.35)
+            for img, rect in zip(self.clock_images[:6], self.clock_rects):
+                if img.get_width() > 1:
+                    if dimmed:
+                        img = img.copy()
+                        img.set_alpha(140)
+                    composite.blit(img, rect.topleft)
+            self._menu_composites[dimmed] = composite
+        return composite
+
+    def _menu_accuse_button(self, hover: bool) -> pygame.Surface:
+        """Menu Accuse button (fill, border, label) pre-drawn per hover state; corners outside the radius stay transparent."""
+        button = self._menu_accuse_buttons.get(hover)
+        if button is None:
+            w, h = self._menu_accuse_rect.size
+            button = self._menu_accuse_buttons[hover] = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(button, (90, 120, 170) if hover else (50, 70, 110), (0, 0, w, h), border_radius=8)
+            pygame.draw.rect(button, (120, 150, 200), (0, 0, w, h), 2, border_radius=8)
+            acc_text = self._render_text(self.text_font, "Accuse", (230, 235, 245))
+            button.blit(acc_text, (w // 2 - acc_text.get_width() // 2, h // 2 - acc_text.get_height() // 2))
+        return button
+
     def _draw_menu_impl(self) -> None:
         """Actual menu draw (called when state is menu)."""
+        self._load_menu_assets()
+        # Only ask the mixer once the last beat is nearly over (get_busy is not needed mid-beat)
+        if self.sounds and self._time_accum >= self._heartbeat_until and (
+            self.heartbeat_channel is None or not self.heartbeat_channel.get_busy()
+        ):
+            self.heartbeat_channel = self.sounds["heartbeat"].play(loops=0)
+            if self.heartbeat_channel is not None:
+                self.heartbeat_channel.set_volume(0.2)
+                self._heartbeat_until = self._time_accum + self.sounds["heartbeat"].get_length() - 0.05
         t = self.menu_time
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        # Background: menu.png or fallback
-        if self.menu_bg is not None:
-            self.screen.blit(self.menu_bg, (0, 0))
-        else:
-            self.screen.fill((18, 22, 35))
-            draw_vignette_fast(self.screen, 0.35)
-        draw_glitch_overlay(self.screen, 0.06, t)
-        # Clocks: c1–c6 images around center crystal (when assets loaded)
+        clock_art = len(self.clock_images) >= 6 and len(self.clock_rects) >= 6 and self.clock_rects[0].width > 0
         hovered_clock_idx = -1
-        if len(self.clock_images) >= 6 and len(self.clock_rects) >= 6 and self.clock_rects[0].width > 0:
-            for idx in range(6):
-                img = self.clock_images[idx]
-                rect = self.clock_rects[idx]
-                hovered = rect.collidepoint(mouse_x, mouse_y) and self.global_time > 0
-                if hovered:
-                    hovered_clock_idx = idx
-                if img.get_width() > 1:
-                    if self.global_time <= 0:
-                        dimmed = img.copy()
-                        dimmed.set_alpha(140)
-                        self.screen.blit(dimmed, rect.topleft)
-                    else:
-                        self.screen.blit(img, rect.topleft)
-                        if hovered:
-                            lighten = img.copy()
-                            lighten.set_alpha(70)
-                            self.screen.blit(lighten, rect.topleft, special_flags=pygame.BLEND_RGBA_ADD)
+        if clock_art and self.global_time > 0:
+            self._pointer_rect.topleft = (mouse_x, mouse_y)
+            hovered_clock_idx = self._pointer_rect.collidelist(self.clock_rects[:6])
+        accuse_hover = self._menu_accuse_rect.collidepoint(mouse_x, mouse_y)
+        fill_w = 0
+        if self.GLOBAL_TIME_LIMIT > 0:
+            fill_w = int(self._menu_timer_bar.w * (self.global_time / self.GLOBAL_TIME_LIMIT))
+        # With clock art nothing else moves: if none of these changed since the last presented
+        # menu frame, the back buffer already holds this frame, so skip drawing and presenting
+        frame_key = (
+            self.global_time <= 0, hovered_clock_idx, accuse_hover, fill_w, int(self.global_time), len(self.snapshots),
+        )
+        if clock_art and self._full_frame_state == "menu" and frame_key == self._menu_frame_key:
+            self._menu_dirty = []
+            return
+        self._menu_frame_key = frame_key
+        # Clocks: c1–c6 images around center crystal (when assets loaded)
+        composite = None
+        hover_regions: List[pygame.Rect] = []
+        if clock_art:
+            # Background and all six clocks come pre-composited; only the hover lighten is per frame
+            composite = self._menu_composite(self.global_time <= 0)
+            self.screen.blit(composite, (0, 0))
+            if hovered_clock_idx >= 0 and self.clock_images[hovered_clock_idx].get_width() > 1:
+                lighten = self._clock_highlights.get(hovered_clock_idx)
+                if lighten is None:
+                    lighten = self._clock_highlights[hovered_clock_idx] = self.clock_images[hovered_clock_idx].copy()
+                    lighten.set_alpha(70)
+                self.screen.blit(
+                    lighten, self.clock_rects[hovered_clock_idx].topleft, special_flags=pygame.BLEND_RGBA_ADD,
+                )
+                hover_regions.append(self.clock_rects[hovered_clock_idx])
             # Scene description when hovering a clock (centered above timer bar)
             if hovered_clock_idx >= 0 and hovered_clock_idx < len(self.clock_scene_descriptions):
                 desc = self.clock_scene_descriptions[hovered_clock_idx]
-                desc_surf = self.text_font.render(desc, True, (240, 242, 250))
+                desc_surf = self._render_text(self.text_font, desc, (240, 242, 250))
                 desc_rect = desc_surf.get_rect(center=(self.WIDTH // 2, 50))
                 pad = 10
                 bg_rect = desc_rect.inflate(pad * 2, pad)
-                bg = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                bg.fill((0, 0, 0, 200))
-                self.screen.blit(bg, bg_rect.topleft)
+                self.screen.blit(_overlay_surface(bg_rect.size, (0, 0, 0, 200)), bg_rect.topleft)
                 pygame.draw.rect(self.screen, (90, 100, 130), bg_rect, 1, border_radius=6)
                 self.screen.blit(desc_surf, desc_rect)
+                hover_regions.append(bg_rect)
         else:
-            # Fallback: procedural clock circles (only need fill if we didn't draw menu_bg)
-            if self.menu_bg is None:
-                self.screen.fill((18, 22, 35))
-                draw_vignette_fast(self.screen, 0.35)
-            for idx, scene in enumerate(self.scenes):
-                cx, cy = self._clock_center(idx)
-                hover = (mouse_x - cx) ** 2 + (mouse_y - cy) ** 2 <= self.CLOCK_RADIUS ** 2
-                base_color = (60, 70, 90) if self.global_time <= 0 else ((100, 160, 220) if hover else (80, 130, 190))
-                pulse = 0.8 + 0.2 * math.sin(t * 2 + idx * 0.5)
-                draw_glowing_circle(self.screen, (cx, cy), self.CLOCK_RADIUS - 4, base_color, pulse)
-                tick_angle = (t * 0.5 + idx) % (2 * math.pi)
-                tx = cx + (self.CLOCK_RADIUS - 12) * math.cos(tick_angle)
-                ty = cy + (self.CLOCK_RADIUS - 12) * math.sin(tick_angle)
-                pygame.draw.line(self.screen, (200, 220, 255), (cx, cy), (int(tx), int(ty)), 2)
-                lbl = self.text_font.render(scene.label, True, (25, 30, 45))
-                self.screen.blit(lbl, (cx - lbl.get_width() // 2, cy - lbl.get_height() // 2))
+            # Background: menu.png, or the plain vignetted fill built once
+            if self.menu_bg is not None:
+                self.screen.blit(self.menu_bg, (0, 0))
+            else:
+                if self._menu_plain_bg is None:
+                    self._menu_plain_bg = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+                    self._menu_plain_bg.fill((18, 22, 35))
+                    draw_vignette_fast(self._menu_plain_bg, 0.35)
+                self.screen.blit(self._menu_plain_bg, (0, 0))
+            # Fallback: procedural clock circles
+            # Labels are collected and blitted in one batch after all the clock faces
+            labels = self._blit_pairs
+            labels.clear()
+            # Per-frame constants hoisted out of the loop; centres come from the fixed grid
+            screen, font, colors = self.screen, self.text_font, self.CLOCK_COLORS
+            radius = self.CLOCK_RADIUS
+            radius_sq, face_r, hand_r = radius * radius, radius - 4, radius - 12
+            time_up = self.global_time <= 0
+            pulse_t, hand_t = t * 2, t * 0.5
+            sin, cos, tau = math.sin, math.cos, math.tau
+            for idx, (scene, (cx, cy)) in enumerate(zip(self.scenes, self._clock_centers)):
+                hover = (mouse_x - cx) ** 2 + (mouse_y - cy) ** 2 <= radius_sq
+                base_color = colors[time_up << 1 | hover]
+                pulse = 0.8 + 0.2 * sin(pulse_t + idx * 0.5)
+                draw_glowing_circle(screen, (cx, cy), face_r, base_color, pulse)
+                tick_angle = (hand_t + idx) % tau
+                tx = cx + hand_r * cos(tick_angle)
+                ty = cy + hand_r * sin(tick_angle)
+                pygame.draw.line(screen, (200, 220, 255), (cx, cy), (int(tx), int(ty)), 2)
+                lbl = self._render_text(font, scene.label, (25, 30, 45))
+                labels.append((lbl, (cx - lbl.get_width() // 2, cy - lbl.get_height() // 2)))
+            self._batch_blit(labels)
         # Timer bar and text (on top of menu)
-        bar_x, bar_y = 50, 72
-        bar_w, bar_h = self.WIDTH - 100, 10
-        overlay = pygame.Surface((bar_w + 20, 50), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (bar_x - 10, bar_y - 8))
-        pygame.draw.rect(self.screen, (30, 38, 55), (bar_x, bar_y, bar_w, bar_h), border_radius=4)
+        bar_x, bar_y, bar_w, bar_h = bar = self._menu_timer_bar
+        timer_area = pygame.Rect(bar_x - 10, bar_y - 8, bar_w + 20, 50)
+        self.screen.blit(_overlay_surface(timer_area.size, (0, 0, 0, 120)), timer_area.topleft)
+        pygame.draw.rect(self.screen, (30, 38, 55), bar, border_radius=4)
         if self.GLOBAL_TIME_LIMIT > 0:
-            pct = self.global_time / self.GLOBAL_TIME_LIMIT
-            pygame.draw.rect(self.screen, (70, 140, 200), (bar_x, bar_y, int(bar_w * pct), bar_h), border_radius=4)
-        timer_text = self.small_font.render(f"{int(self.global_time)}s left  ·  Snapshots: {len(self.snapshots)}/{self.MAX_SNAPSHOTS}", True, (180, 190, 210))
-        self.screen.blit(timer_text, (self.WIDTH // 2 - timer_text.get_width() // 2, bar_y + 14))
-        if self.sounds and (self.heartbeat_channel is None or not self.heartbeat_channel.get_busy()):
-            self.heartbeat_channel = self.sounds["heartbeat"].play(loops=0)
-            if self.heartbeat_channel is not None:
-                self.heartbeat_channel.set_volume(0.2)
+            pygame.draw.rect(self.screen, (70, 140, 200), (bar_x, bar_y, fill_w, bar_h), border_radius=4)
+        # Timer line and time's-up warning go out in one batch
+        texts = self._blit_pairs
+        texts.clear()
+        timer_text = self._render_text(self.small_font, f"{int(self.global_time)}s left  ·  Snapshots: {len(self.snapshots)}/{self.MAX_SNAPSHOTS}", (180, 190, 210))
+        texts.append((timer_text, (self.WIDTH // 2 - timer_text.get_width() // 2, bar_y + 14)))
         if self.global_time <= 0 and len(self.snapshots) < self.MAX_SNAPSHOTS:
-            warn = self.small_font.render("Time's up. Proceed to accusation.", True, (220, 100, 100))
-            self.screen.blit(warn, (self.WIDTH // 2 - warn.get_width() // 2, bar_y + 36))
+            warn = self._render_text(self.small_font, "Time's up. Proceed to accusation.", (220, 100, 100))
+            texts.append((warn, (self.WIDTH // 2 - warn.get_width() // 2, bar_y + 36)))
+            timer_area.union_ip(warn.get_rect(topleft=texts[-1][1]))
+        self._batch_blit(texts)
         # Accuse button (bottom-right)
-        accuse_rect = pygame.Rect(self.WIDTH - 200, self.HEIGHT - 56, 180, 42)
-        accuse_hover = accuse_rect.collidepoint(mouse_x, mouse_y)
-        btn_color = (90, 120, 170) if accuse_hover else (50, 70, 110)
-        pygame.draw.rect(self.screen, btn_color, accuse_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (120, 150, 200), accuse_rect, 2, border_radius=8)
-        acc_text = self.text_font.render("Accuse", True, (230, 235, 245))
-        self.screen.blit(acc_text, (accuse_rect.centerx - acc_text.get_width() // 2, accuse_rect.centery - acc_text.get_height() // 2))
+        accuse_rect = self._menu_accuse_rect
+        self.screen.blit(self._menu_accuse_button(accuse_hover), accuse_rect.topleft)
+        hover_regions.append(accuse_rect)
+
+        # What run() presents: the timer block when its fill width (whole pixels) or text changed,
+        # plus the old and new hover regions when the hover changed. The procedural clocks
+        # animate, so that path presents it all.
+        prev_composite, prev_hover, prev_regions = self._menu_last_frame
+        hover = (hovered_clock_idx, accuse_hover)
+        timer_key = (fill_w, *texts)
+        if composite is None or composite is not prev_composite:
+            self._menu_dirty = None
+        else:
+            self._menu_dirty = [] if timer_key == self._menu_timer_key else [timer_area]
+            if hover != prev_hover:
+                self._menu_dirty += prev_regions + hover_regions
+        self._menu_last_frame = (composite, hover, hover_regions)
+        self._menu_timer_key = timer_key
 
 
 def main() -> None:
+    pygame.mixer.pre_init(**MIXER_SETTINGS)
     pygame.init()
     screen = pygame.display.set_mode((VanishingMemoriesGame.WIDTH, VanishingMemoriesGame.HEIGHT))
     game = VanishingMemoriesGame(screen)